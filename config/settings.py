@@ -269,6 +269,11 @@ class SmartWalletConfig:
     # Data sources
     track_pump_graduates: bool = True
     track_dex_winners: bool = True
+    
+    # Scan throughput
+    scan_concurrency: int = 16  # wallets checked at once
+    scan_rate_limit: int = 10  # wallet API requests per second
+    activity_horizon: int = 100  # most recent activities kept for signals
 
 SMART_WALLET_CONFIG = SmartWalletConfig()
 
@@ -309,14 +309,21 @@ class Database:
     # ============================================================
     
     async def upsert_smart_wallet(self, wallet: SmartWallet):
-        await self.connection.execute("""
+        await self.upsert_smart_wallets_bulk([wallet])
+    
+    async def upsert_smart_wallets_bulk(self, wallets: List[SmartWallet]):
+        """Upsert many wallets in one statement batch and a single commit"""
+        if not wallets:
+            return
+        assert self.connection is not None, "Database not connected"
+        await self.connection.executemany("""
             INSERT OR REPLACE INTO smart_wallets 
                 (address, chain, total_trades, winning_trades, total_profit, 
                  win_rate, avg_return, last_trade, tags, updated_at)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-        """, (wallet.address, wallet.chain, wallet.total_trades, wallet.winning_trades,
-              wallet.total_profit, wallet.win_rate, wallet.avg_return, 
-              wallet.last_trade, wallet.tags))
+        """, [(w.address, w.chain, w.total_trades, w.winning_trades,
+               w.total_profit, w.win_rate, w.avg_return,
+               w.last_trade, w.tags) for w in wallets])
         await self.connection.commit()
     
     async def get_smart_wallets(self, chain: Optional[str] = None, 
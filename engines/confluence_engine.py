@@ -127,12 +127,12 @@ class ConfluenceEngine:
             name="safety_passed",
             active=active,
             weight=self.signal_weights["safety_passed"] if active else 0,
-            reason="Contract verified safe" if active else f"Safety: {safety.status.value}",
+            reason="Contract verified safe" if active else f"Safety: {safety.status.label}",
             data={"score": safety.score}
         ))
         
         if not active:
-            result.rejection_reasons.append(f"Safety check failed: {safety.status.value}")
+            result.rejection_reasons.append(f"Safety check failed: {safety.status.label}")
     
     def _check_liquidity(self, result: ConfluenceResult, pair: TokenPair):
         """Check liquidity signal"""
@@ -4,7 +4,7 @@ Complete position lifecycle management with TP/SL
 """
 
 import asyncio
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 from dataclasses import dataclass, field
 from datetime import datetime
 import json
@@ -128,6 +128,9 @@ class PositionManager:
     def __init__(self, mode: TradingMode = TradingMode.SIMULATION):
         self.mode = mode
         self.positions: Dict[int, ActivePosition] = {}
+        self._pending_delete: Set[int] = set()
+        # Entries check limits/capital before awaiting the buy; serialize them
+        self._entry_lock = asyncio.Lock()
         self.execution = None
         self.dexscreener = None
         self.db = None
@@ -221,6 +224,13 @@ class PositionManager:
         Returns:
             ActivePosition or None
         """
+        async with self._entry_lock:
+            return await self._open_position(chain, token_address, symbol, pool,
+                                             entry_price, size_usd)
+    
+    async def _open_position(self, chain: Chain, token_address: str, symbol: str,
+                             pool: str, entry_price: float, size_usd: float) -> Optional[ActivePosition]:
+        """Open a position; caller holds _entry_lock"""
         # Check if paused
         if self.is_paused:
             if self.pause_until and datetime.utcnow() < self.pause_until:
@@ -230,13 +240,11 @@ class PositionManager:
         
         # Check position limits
         pool_config = SAFE_POOL if pool == "SAFE" else HUNT_POOL
-        pool_positions = len([p for p in self.positions.values() if p.pool == pool])
-        
-        if pool_positions >= pool_config.max_positions:
+        if self.get_position_count(pool) >= pool_config.max_positions:
             logger.warning(f"{pool} pool at max positions ({pool_config.max_positions})")
             return None
         
-        if len(self.positions) >= TRADING_CONFIG.max_total_positions:
+        if self.get_position_count() >= TRADING_CONFIG.max_total_positions:
             logger.warning(f"Total positions at max ({TRADING_CONFIG.max_total_positions})")
             return None
         
@@ -325,7 +333,12 @@ class PositionManager:
     
     async def update_positions(self):
         """Update all position prices and check TP/SL"""
-        for pos in list(self.positions.values()):
+        # Snapshot ids; closes during the tick are deferred until it ends
+        ids = tuple(self.positions)
+        for pid in ids:
+            pos = self.positions.get(pid)
+            if pos is None or pid in self._pending_delete:
+                continue
             try:
                 # Get current price
                 price = await self.dexscreener.get_price(pos.chain, pos.token_address)
@@ -348,6 +361,14 @@ class PositionManager:
                     
             except Exception as e:
                 logger.error(f"Error updating position {pos.symbol}: {e}")
+        
+        self._apply_pending_deletes()
+    
+    def _apply_pending_deletes(self):
+        """Drop positions closed during the last tick"""
+        for pid in self._pending_delete:
+            self.positions.pop(pid, None)
+        self._pending_delete.clear()
     
     async def _check_take_profits(self, pos: ActivePosition):
         """Check and execute take profit levels"""
@@ -447,7 +468,7 @@ class PositionManager:
     
     async def _close_position(self, pos: ActivePosition, reason: str):
         """Close a position completely"""
-        if pos.remaining_quantity <= 0:
+        if pos.remaining_quantity <= 0 or pos.position_id in self._pending_delete:
             return
         
         # Execute sell
@@ -500,16 +521,16 @@ class PositionManager:
             else:
                 self.consecutive_losses = 0
             
-            # Remove from active positions
-            if pos.position_id in self.positions:
-                del self.positions[pos.position_id]
+            # Removed from active positions once the current tick finishes
+            self._pending_delete.add(pos.position_id)
             
             logger.info(f"Closed {pos.symbol}: {reason} | PnL: ${total_pnl:+.2f} ({pos.pnl_percent:+.1f}%)")
     
     async def close_all_positions(self, reason: str = "MANUAL"):
         """Emergency close all positions"""
-        for pos in list(self.positions.values()):
+        for pos in tuple(self.positions.values()):
             await self._close_position(pos, reason)
+        self._apply_pending_deletes()
     
     # ============================================================
     # CIRCUIT BREAKER
@@ -544,15 +565,21 @@ class PositionManager:
         prices = {Chain.SOL: 100, Chain.BSC: 300, Chain.BASE: 2000}
         return prices.get(chain, 100)
     
+    def _live_positions(self) -> List[ActivePosition]:
+        """Open positions, excluding ones closed earlier in the current tick"""
+        if not self._pending_delete:
+            return list(self.positions.values())
+        return [p for pid, p in self.positions.items() if pid not in self._pending_delete]
+    
     def get_position_count(self, pool: Optional[str] = None) -> int:
         """Get count of open positions"""
         if pool:
-            return len([p for p in self.positions.values() if p.pool == pool])
-        return len(self.positions)
+            return len([p for p in self._live_positions() if p.pool == pool])
+        return len(self.positions) - len(self._pending_delete)
     
     def get_total_exposure(self) -> float:
         """Get total current exposure in USD"""
-        return sum(p.current_value for p in self.positions.values())
+        return sum(p.current_value for p in self._live_positions())
     
     def get_portfolio_summary(self) -> Dict:
         """Get portfolio summary"""
@@ -5,23 +5,97 @@ Comprehensive contract security analysis using GoPlus API
 
 import asyncio
 import aiohttp
+import orjson
 import time
-from typing import Dict, Optional, List, Any
+from collections import OrderedDict, deque
+from functools import cache
+from typing import Deque, Dict, Optional, List, Any, Tuple, TypedDict, cast
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
 import logging
 
+from yarl import URL
+
 from config.settings import Chain, API_CONFIG, TRADING_CONFIG
 
 logger = logging.getLogger(__name__)
 
-class SafetyStatus(Enum):
-    SAFE = "safe"
-    WARNING = "warning"
-    DANGEROUS = "dangerous"
-    UNKNOWN = "unknown"
+# Score deduction per failed check severity
+_SEV = {"high": 25, "medium": 10, "low": 5}
+
+# GoPlus EVM "1"/"0" flags: (check name, field, report attr, severity, msg if set, msg if clear)
+_EVM_FLAGS = (
+    ("honeypot", "is_honeypot", "is_honeypot", "high", "HONEYPOT!", "Not honeypot"),
+    ("mint_function", "is_mintable", "has_mint", "high", "Mintable", "Not mintable"),
+    ("proxy_contract", "is_proxy", "is_proxy", "high", "Proxy contract", "Not proxy"),
+)
+
+# Flags set when either of two fields is "1"
+_EVM_ANY_FLAGS = (
+    ("can_pause", "can_take_back_ownership", "trading_cooldown", "can_pause", "high",
+     "Can pause", "Cannot pause"),
+    ("blacklist", "is_blacklisted", "is_whitelisted", "has_blacklist", "medium",
+     "Has blacklist", "No blacklist"),
+)
+
+# Rejection reasons: (predicate, message template formatted with r=report)
+_REJECT_RULES = (
+    (lambda r: r.is_honeypot, "🚨 HONEYPOT - Cannot sell"),
+    (lambda r: r.has_mint, "⚠️ Mint function enabled"),
+    (lambda r: r.is_proxy, "⚠️ Proxy contract"),
+    (lambda r: r.can_pause, "⚠️ Can pause trading"),
+    (lambda r: r.has_blacklist, "⚠️ Has blacklist"),
+    (lambda r: r.tax_buy > TRADING_CONFIG.max_tax_percent, "⚠️ High buy tax: {r.tax_buy:.1f}%"),
+    (lambda r: r.tax_sell > TRADING_CONFIG.max_tax_percent, "⚠️ High sell tax: {r.tax_sell:.1f}%"),
+    (lambda r: not r.lp_locked, "⚠️ LP not locked"),
+    (lambda r: r.holder_count < TRADING_CONFIG.min_holders, "⚠️ Low holders: {r.holder_count}"),
+    (lambda r: r.top_holder_percent > TRADING_CONFIG.max_top_holder_percent,
+     "⚠️ Concentrated: {r.top_holder_percent:.1f}%"),
+)
+
+# GoPlus payload shapes (only the fields the parsers read)
+class GoPlusLPHolder(TypedDict, total=False):
+    is_locked: int
+
+class GoPlusEvmToken(TypedDict, total=False):
+    is_honeypot: str
+    is_mintable: str
+    is_proxy: str
+    can_take_back_ownership: str
+    trading_cooldown: str
+    is_blacklisted: str
+    is_whitelisted: str
+    buy_tax: str
+    sell_tax: str
+    owner_address: str
+    is_renounced: str
+    holder_count: str
+    lp_holders: List[GoPlusLPHolder]
+
+class GoPlusSolanaHolder(TypedDict, total=False):
+    percentage: str
+
+class GoPlusSolanaLPInfo(TypedDict, total=False):
+    lpLocked: float
+
+class GoPlusSolanaToken(TypedDict, total=False):
+    mintAuthority: Optional[str]
+    freezeAuthority: Optional[str]
+    lpInfo: GoPlusSolanaLPInfo
+    holders: List[GoPlusSolanaHolder]
+
+class SafetyStatus(IntEnum):
+    """Ordered so status checks are plain integer compares"""
+    UNKNOWN = 0
+    DANGEROUS = 1
+    WARNING = 2
+    SAFE = 3
+    
+    @property
+    def label(self) -> str:
+        return self.name.lower()
 
-@dataclass
+@dataclass(slots=True)
 class SafetyCheck:
     name: str
     passed: bool
@@ -29,12 +103,13 @@ class SafetyCheck:
     message: str
     severity: str = "high"  # high, medium, low
 
-@dataclass
+@dataclass(slots=True)
 class SafetyReport:
     token_address: str
     chain: Chain
     status: SafetyStatus = SafetyStatus.UNKNOWN
-    checks: List[SafetyCheck] = field(default_factory=list)
+    # (name, passed, value, message, severity) - promoted to SafetyCheck on access
+    _raw_checks: List[tuple] = field(default_factory=list, repr=False)
     score: int = 0
     
     # Quick flags
@@ -52,19 +127,29 @@ class SafetyReport:
     holder_count: int = 0
     top_holder_percent: float = 0
     analyzed_at: float = field(default_factory=time.time)
+    # Lazily built by failed_checks; slots rule out functools.cached_property
+    _failed_checks: Optional[List[SafetyCheck]] = field(default=None, init=False,
+                                                        repr=False, compare=False)
     
     @property
     def is_safe(self) -> bool:
         return self.status == SafetyStatus.SAFE
     
+    @property
+    def checks(self) -> List[SafetyCheck]:
+        return [SafetyCheck(*c) for c in self._raw_checks]
+    
     @property
     def failed_checks(self) -> List[SafetyCheck]:
-        return [c for c in self.checks if not c.passed]
+        """Computed once; reports are not modified after analysis completes"""
+        if self._failed_checks is None:
+            self._failed_checks = [SafetyCheck(*c) for c in self._raw_checks if not c[1]]
+        return self._failed_checks
     
     def to_dict(self) -> Dict:
         return {
             "token": self.token_address, "chain": self.chain.value,
-            "status": self.status.value, "score": self.score,
+            "status": self.status.label, "score": self.score,
             "honeypot": self.is_honeypot, "mint": self.has_mint,
             "tax_buy": self.tax_buy, "tax_sell": self.tax_sell,
             "renounced": self.is_renounced, "lp_locked": self.lp_locked,
@@ -77,17 +162,36 @@ class SafetyEngine:
     """Contract safety analysis using GoPlus Security API"""
     
     CHAIN_MAP = {Chain.SOL: "solana", Chain.BSC: "56", Chain.BASE: "8453"}
+    BATCH_SIZE = 50  # GoPlus contract_addresses cap per request
     
     def __init__(self):
         self.base_url = API_CONFIG.goplus_base
+        # Prebuilt endpoint URLs; aiohttp uses URL objects without re-parsing
+        self._evm_urls: Dict[Chain, URL] = {
+            chain: URL(f"{self.base_url}/token_security/{chain_id}")
+            for chain, chain_id in self.CHAIN_MAP.items() if chain != Chain.SOL
+        }
+        self._sol_base = URL(f"{self.base_url}/solana/token_security")
         self.rate_limit = API_CONFIG.goplus_rate_limit
         self.session: Optional[aiohttp.ClientSession] = None
-        self.request_times: List[float] = []
-        self.cache: Dict[str, SafetyReport] = {}
+        self.request_times: Deque[float] = deque()
+        self.request_semaphore = asyncio.Semaphore(self.rate_limit)
+        self.cache: "OrderedDict[str, SafetyReport]" = OrderedDict()
         self.cache_ttl: int = 300
+        self.cache_max_size: int = 4096
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # quick_check passes: cache key -> monotonic expiry
+        self._quick_passed: Dict[str, float] = {}
+        self.quick_ttl: int = 30
     
     async def start(self):
-        self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
+        connector = aiohttp.TCPConnector(
+            limit=self.rate_limit, limit_per_host=10, ttl_dns_cache=300,
+            enable_cleanup_closed=True, keepalive_timeout=75
+        )
+        self.session = aiohttp.ClientSession(connector=connector,
+                                             timeout=aiohttp.ClientTimeout(total=30),
+                                             headers={"Accept-Encoding": "gzip"})
     
     async def stop(self):
         if self.session:
@@ -95,35 +199,45 @@ class SafetyEngine:
             self.session = None
     
     def _check_rate_limit(self) -> bool:
-        now = time.time()
-        self.request_times = [t for t in self.request_times if now - t < 60]
+        now = time.monotonic()
+        while self.request_times and now - self.request_times[0] >= 60:
+            self.request_times.popleft()
         return len(self.request_times) < self.rate_limit
     
-    async def _request(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
+    async def _request(self, url: URL, params: Dict = None) -> Optional[Dict]:
         if not self.session: await self.start()
         if not self._check_rate_limit():
             await asyncio.sleep(1)
         
-        self.request_times.append(time.time())
-        url = f"{self.base_url}/{endpoint}"
+        self.request_times.append(time.monotonic())
         
-        try:
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    if data.get("code") == 1:
-                        return data.get("result", {})
-        except Exception as e:
-            logger.warning(f"GoPlus error: {e}")
+        async with self.request_semaphore:
+            try:
+                async with self.session.get(url, params=params) as response:
+                    if response.status == 200:
+                        data = orjson.loads(await response.read())
+                        if data.get("code") == 1:
+                            return data.get("result", {})
+            except Exception as e:
+                logger.warning(f"GoPlus error: {e}")
         return None
     
     def _get_cache(self, key: str) -> Optional[SafetyReport]:
-        if key in self.cache:
-            report = self.cache[key]
-            if time.time() - report.analyzed_at < self.cache_ttl:
-                return report
+        report = self.cache.get(key)
+        if report is None:
+            return None
+        if time.time() - report.analyzed_at >= self.cache_ttl:
             del self.cache[key]
-        return None
+            return None
+        self.cache.move_to_end(key)
+        return report
+    
+    def _set_cache(self, key: str, report: SafetyReport):
+        """Store a report, evicting least recently used entries past capacity"""
+        self.cache[key] = report
+        self.cache.move_to_end(key)
+        while len(self.cache) > self.cache_max_size:
+            self.cache.popitem(last=False)
     
     async def analyze(self, chain: Chain, token_address: str) -> SafetyReport:
         """Full safety analysis of a token"""
@@ -131,105 +245,139 @@ class SafetyEngine:
         cached = self._get_cache(cache_key)
         if cached: return cached
         
+        # Concurrent callers for the same token share a single GoPlus request
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
         report = SafetyReport(token_address=token_address, chain=chain)
+        try:
+            await self._run_analysis(report, cache_key)
+        finally:
+            del self._inflight[cache_key]
+            future.set_result(report)
+        
+        return report
+    
+    async def _run_analysis(self, report: SafetyReport, cache_key: str):
+        """Fetch, parse and score a report in place"""
+        chain, token_address = report.chain, report.token_address
         chain_id = self.CHAIN_MAP.get(chain)
         if not chain_id:
             report.status = SafetyStatus.UNKNOWN
-            return report
+            return
         
         # Fetch security data
         if chain == Chain.SOL:
-            data = await self._request(f"solana/token_security/{token_address}")
+            data = await self._request(self._sol_base / token_address)
         else:
-            data = await self._request(f"token_security/{chain_id}", 
+            data = await self._request(self._evm_urls[chain],
                                        {"contract_addresses": token_address})
         
         if not data:
             report.status = SafetyStatus.UNKNOWN
-            report.checks.append(SafetyCheck("api_response", False, None, "Failed to fetch", "high"))
-            return report
+            report._raw_checks.append(("api_response", False, None, "Failed to fetch", "high"))
+            return
         
-        # Parse response
+        # Parse response, accumulating the score as checks are decided
+        penalty, critical_fail = 0, False
         if chain == Chain.SOL:
-            self._parse_solana(report, data)
+            penalty, critical_fail = self._parse_solana(report, cast(GoPlusSolanaToken, data))
         else:
             token_data = data.get(token_address.lower(), {})
             if token_data:
-                self._parse_evm(report, token_data)
+                penalty, critical_fail = self._parse_evm(report, token_data)
             else:
                 report.status = SafetyStatus.UNKNOWN
         
-        # Calculate score and status
-        self._calculate_score(report)
-        self.cache[cache_key] = report
-        
-        return report
+        # Score and status
+        self._finalize(report, penalty, critical_fail)
+        self._set_cache(cache_key, report)
     
-    def _parse_solana(self, report: SafetyReport, data: Dict):
-        """Parse Solana security response"""
+    def _parse_solana(self, report: SafetyReport, data: GoPlusSolanaToken) -> Tuple[int, bool]:
+        """Parse Solana security response, returning (penalty, critical_fail)"""
+        checks_append = report._raw_checks.append
+        penalty = 0
+        critical = False
+        
         # Mint authority
         mint = data.get("mintAuthority")
         has_mint = mint is not None and mint != ""
         report.has_mint = has_mint
-        report.checks.append(SafetyCheck("mint_function", not has_mint, mint,
+        checks_append(("mint_function", not has_mint, mint,
             "Mint authority exists" if has_mint else "No mint", "high"))
+        if has_mint:
+            penalty += _SEV["high"]
+            critical = True
         
         # Freeze authority
         freeze = data.get("freezeAuthority")
         has_freeze = freeze is not None and freeze != ""
-        report.checks.append(SafetyCheck("freeze_authority", not has_freeze, freeze,
+        checks_append(("freeze_authority", not has_freeze, freeze,
             "Freeze authority exists" if has_freeze else "No freeze", "high"))
+        if has_freeze:
+            penalty += _SEV["high"]
+            critical = True
         
         # LP info
         lp_info = data.get("lpInfo", {})
         if lp_info:
             lp_locked = lp_info.get("lpLocked", 0) > 50
             report.lp_locked = lp_locked
-            report.checks.append(SafetyCheck("lp_locked", lp_locked,
+            checks_append(("lp_locked", lp_locked,
                 lp_info.get("lpLocked", 0), f"LP {lp_info.get('lpLocked', 0)}% locked", "high"))
+            if not lp_locked:
+                penalty += _SEV["high"]
+                critical = True
         
         # Holders
         holders = data.get("holders", [])
         if holders:
-            report.holder_count = len(holders)
-            top = max(holders, key=lambda h: float(h.get("percentage", 0)), default={})
-            report.top_holder_percent = float(top.get("percentage", 0))
+            count = 0
+            top_pct = 0.0
+            for h in holders:
+                pct = float(h.get("percentage", 0) or 0)
+                if pct > top_pct:
+                    top_pct = pct
+                count += 1
+            report.holder_count = count
+            report.top_holder_percent = top_pct
             concentrated = report.top_holder_percent > TRADING_CONFIG.max_top_holder_percent
-            report.checks.append(SafetyCheck("holder_concentration", not concentrated,
+            checks_append(("holder_concentration", not concentrated,
                 report.top_holder_percent, f"Top: {report.top_holder_percent:.1f}%",
                 "high" if concentrated else "low"))
+            if concentrated:
+                penalty += _SEV["high"]
+                critical = True
+        
+        return penalty, critical
     
-    def _parse_evm(self, report: SafetyReport, data: Dict):
-        """Parse EVM (BSC, Base) security response"""
-        # Honeypot
-        honeypot = data.get("is_honeypot") == "1"
-        report.is_honeypot = honeypot
-        report.checks.append(SafetyCheck("honeypot", not honeypot, honeypot,
-            "HONEYPOT!" if honeypot else "Not honeypot", "high"))
-        
-        # Mint
-        mint = data.get("is_mintable") == "1"
-        report.has_mint = mint
-        report.checks.append(SafetyCheck("mint_function", not mint, mint,
-            "Mintable" if mint else "Not mintable", "high"))
-        
-        # Proxy
-        proxy = data.get("is_proxy") == "1"
-        report.is_proxy = proxy
-        report.checks.append(SafetyCheck("proxy_contract", not proxy, proxy,
-            "Proxy contract" if proxy else "Not proxy", "high"))
-        
-        # Pause
-        pause = data.get("can_take_back_ownership") == "1" or data.get("trading_cooldown") == "1"
-        report.can_pause = pause
-        report.checks.append(SafetyCheck("can_pause", not pause, pause,
-            "Can pause" if pause else "Cannot pause", "high"))
-        
-        # Blacklist
-        blacklist = data.get("is_blacklisted") == "1" or data.get("is_whitelisted") == "1"
-        report.has_blacklist = blacklist
-        report.checks.append(SafetyCheck("blacklist", not blacklist, blacklist,
-            "Has blacklist" if blacklist else "No blacklist", "medium"))
+    def _parse_evm(self, report: SafetyReport, data: GoPlusEvmToken) -> Tuple[int, bool]:
+        """Parse EVM (BSC, Base) security response, returning (penalty, critical_fail)"""
+        checks_append = report._raw_checks.append
+        get = data.get
+        penalty = 0
+        critical = False
+        
+        # Honeypot, mint, proxy
+        for name, key, attr, severity, msg_set, msg_clear in _EVM_FLAGS:
+            flag = get(key) == "1"
+            setattr(report, attr, flag)
+            checks_append((name, not flag, flag, msg_set if flag else msg_clear, severity))
+            if flag:
+                penalty += _SEV[severity]
+                critical = critical or severity == "high"
+        
+        # Pause, blacklist
+        for name, key_a, key_b, attr, severity, msg_set, msg_clear in _EVM_ANY_FLAGS:
+            flag = get(key_a) == "1" or get(key_b) == "1"
+            setattr(report, attr, flag)
+            checks_append((name, not flag, flag, msg_set if flag else msg_clear, severity))
+            if flag:
+                penalty += _SEV[severity]
+                critical = critical or severity == "high"
         
         # Tax
         buy_tax = float(data.get("buy_tax", 0) or 0) * 100
@@ -237,48 +385,62 @@ class SafetyEngine:
         report.tax_buy = buy_tax
         report.tax_sell = sell_tax
         high_tax = buy_tax > TRADING_CONFIG.max_tax_percent or sell_tax > TRADING_CONFIG.max_tax_percent
-        report.checks.append(SafetyCheck("tax", not high_tax,
+        checks_append(("tax", not high_tax,
             {"buy": buy_tax, "sell": sell_tax},
             f"Tax: {buy_tax:.1f}%/{sell_tax:.1f}%", "high" if high_tax else "low"))
+        if high_tax:
+            penalty += _SEV["high"]
+            critical = True
         
         # Ownership
         owner = data.get("owner_address", "")
         renounced = data.get("is_renounced") == "1" or owner == "0x" + "0" * 40
         report.owner_address = owner
         report.is_renounced = renounced
-        report.checks.append(SafetyCheck("ownership", renounced, owner,
+        checks_append(("ownership", renounced, owner,
             "Renounced" if renounced else f"Owner: {owner[:10]}...", "medium"))
+        if not renounced:
+            penalty += _SEV["medium"]
         
         # Holders
         holders = int(data.get("holder_count", 0) or 0)
         report.holder_count = holders
         enough = holders >= TRADING_CONFIG.min_holders
-        report.checks.append(SafetyCheck("holder_count", enough, holders,
+        checks_append(("holder_count", enough, holders,
             f"{holders} holders", "medium"))
+        if not enough:
+            penalty += _SEV["medium"]
         
         # LP
         lp_holders = data.get("lp_holders", [])
         lp_locked = any(lp.get("is_locked") == 1 for lp in lp_holders)
         report.lp_locked = lp_locked
-        report.checks.append(SafetyCheck("lp_locked", lp_locked, lp_locked,
+        checks_append(("lp_locked", lp_locked, lp_locked,
             "LP locked" if lp_locked else "LP not locked", "high"))
+        if not lp_locked:
+            penalty += _SEV["high"]
+            critical = True
+        
+        return penalty, critical
     
     def _calculate_score(self, report: SafetyReport):
-        """Calculate safety score (0-100)"""
-        score = 100
+        """Calculate safety score (0-100) by re-scanning the report's checks"""
+        penalty = 0
         critical_fail = False
         
-        for check in report.checks:
-            if not check.passed:
-                if check.severity == "high":
-                    score -= 25
-                    critical_fail = True
-                elif check.severity == "medium":
-                    score -= 10
-                else:
-                    score -= 5
+        for _, passed, _, _, severity in report._raw_checks:
+            if passed:
+                continue
+            deduction = _SEV.get(severity, 5)
+            penalty += deduction
+            if deduction == 25:
+                critical_fail = True
         
-        report.score = max(0, min(100, score))
+        self._finalize(report, penalty, critical_fail)
+    
+    def _finalize(self, report: SafetyReport, penalty: int, critical_fail: bool):
+        """Set score and status from an accumulated penalty"""
+        report.score = max(0, min(100, 100 - penalty))
         
         if report.is_honeypot:
             report.status = SafetyStatus.DANGEROUS
@@ -296,15 +458,28 @@ class SafetyEngine:
         if chain == Chain.SOL:
             return True  # Solana doesn't have traditional honeypots
         
-        chain_id = self.CHAIN_MAP.get(chain)
-        if not chain_id: return False
+        url = self._evm_urls.get(chain)
+        if not url: return False
+        
+        # Answer from a full report or a recent pass without hitting the API
+        cache_key = f"{chain.value}:{token_address}"
+        report = self._get_cache(cache_key)
+        if report:
+            return not report.is_honeypot
+        now = time.monotonic()
+        if self._quick_passed.get(cache_key, 0) > now:
+            return True
         
-        data = await self._request(f"token_security/{chain_id}",
-                                   {"contract_addresses": token_address})
+        data = await self._request(url, {"contract_addresses": token_address})
         if not data: return False
         
         token_data = data.get(token_address.lower(), {})
-        return token_data.get("is_honeypot") != "1"
+        passed = token_data.get("is_honeypot") != "1"
+        if passed:
+            if len(self._quick_passed) >= self.cache_max_size:
+                self._quick_passed = {k: t for k, t in self._quick_passed.items() if t > now}
+            self._quick_passed[cache_key] = now + self.quick_ttl
+        return passed
     
     async def batch_analyze(self, chain: Chain, addresses: List[str]) -> Dict[str, SafetyReport]:
         """Analyze multiple tokens efficiently"""
@@ -319,62 +494,55 @@ class SafetyEngine:
             else:
                 uncached.append(addr)
         
+        # SOL has no multi-address endpoint; failed EVM batches also fall back
+        fallback = uncached if chain == Chain.SOL else []
+        
         if uncached and chain != Chain.SOL:
-            chain_id = self.CHAIN_MAP.get(chain)
-            data = await self._request(f"token_security/{chain_id}",
-                                       {"contract_addresses": ",".join(uncached)})
-            if data:
-                for addr in uncached:
+            url = self._evm_urls[chain]
+            chunks = [uncached[i:i + self.BATCH_SIZE]
+                      for i in range(0, len(uncached), self.BATCH_SIZE)]
+            responses = await asyncio.gather(*[
+                self._request(url, {"contract_addresses": ",".join(chunk)})
+                for chunk in chunks
+            ])
+            for chunk, data in zip(chunks, responses):
+                if not data:
+                    fallback.extend(chunk)
+                    continue
+                for addr in chunk:
                     report = SafetyReport(token_address=addr, chain=chain)
                     token_data = data.get(addr.lower(), {})
+                    # Finalized even when absent from the response, as analyze() does
+                    penalty, critical_fail = 0, False
                     if token_data:
-                        self._parse_evm(report, token_data)
-                        self._calculate_score(report)
+                        penalty, critical_fail = self._parse_evm(report, token_data)
+                    self._finalize(report, penalty, critical_fail)
                     results[addr] = report
-                    self.cache[f"{chain.value}:{addr}"] = report
-        else:
-            for addr in uncached:
-                results[addr] = await self.analyze(chain, addr)
+                    self._set_cache(f"{chain.value}:{addr}", report)
+        
+        if fallback:
+            reports = await asyncio.gather(*[self.analyze(chain, addr) for addr in fallback],
+                                           return_exceptions=True)
+            for addr, result in zip(fallback, reports):
+                if isinstance(result, BaseException):
+                    logger.warning(f"Safety analysis failed for {addr}: {result}")
+                    result = SafetyReport(token_address=addr, chain=chain)
+                results[addr] = result
         
         return results
     
     def get_rejection_reasons(self, report: SafetyReport) -> List[str]:
         """Get human-readable rejection reasons"""
-        reasons = []
-        if report.is_honeypot:
-            reasons.append("🚨 HONEYPOT - Cannot sell")
-        if report.has_mint:
-            reasons.append("⚠️ Mint function enabled")
-        if report.is_proxy:
-            reasons.append("⚠️ Proxy contract")
-        if report.can_pause:
-            reasons.append("⚠️ Can pause trading")
-        if report.has_blacklist:
-            reasons.append("⚠️ Has blacklist")
-        if report.tax_buy > TRADING_CONFIG.max_tax_percent:
-            reasons.append(f"⚠️ High buy tax: {report.tax_buy:.1f}%")
-        if report.tax_sell > TRADING_CONFIG.max_tax_percent:
-            reasons.append(f"⚠️ High sell tax: {report.tax_sell:.1f}%")
-        if not report.lp_locked:
-            reasons.append("⚠️ LP not locked")
-        if report.holder_count < TRADING_CONFIG.min_holders:
-            reasons.append(f"⚠️ Low holders: {report.holder_count}")
-        if report.top_holder_percent > TRADING_CONFIG.max_top_holder_percent:
-            reasons.append(f"⚠️ Concentrated: {report.top_holder_percent:.1f}%")
-        return reasons
-
+        return [msg.format(r=report) if "{" in msg else msg
+                for pred, msg in _REJECT_RULES if pred(report)]
 
-# Singleton
-_safety_engine: Optional[SafetyEngine] = None
 
+# Singleton (memoized getter; cache_clear() drops the instance)
+@cache
 def get_safety_engine() -> SafetyEngine:
-    global _safety_engine
-    if _safety_engine is None:
-        _safety_engine = SafetyEngine()
-    return _safety_engine
+    return SafetyEngine()
 
 async def shutdown_safety_engine():
-    global _safety_engine
-    if _safety_engine:
-        await _safety_engine.stop()
-        _safety_engine = None
+    if get_safety_engine.cache_info().currsize:
+        await get_safety_engine().stop()
+        get_safety_engine.cache_clear()
@@ -3,17 +3,80 @@ Moonshot Sniper Bot - Scoring Engine
 Quality scoring algorithm with weighted metrics
 """
 
-from typing import Dict, Optional, List
+from bisect import bisect_left, bisect_right
+from functools import cache
+from typing import Dict, Final, Iterable, Literal, Optional, List, Tuple
 from dataclasses import dataclass, field
 import logging
 
+import numpy as np
+
 from config.settings import Chain, SCORING_WEIGHTS, TRADING_CONFIG
 from scanners.dexscreener import TokenPair
-from engines.safety_engine import SafetyReport, SafetyStatus
+from engines.safety_engine import SafetyReport
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# ============================================================
+# SCORING TIERS
+# Ascending thresholds; bisect gives the tier index into the
+# parallel multiplier / label tuples (0 = below first threshold)
+# ============================================================
+
+# Inclusive lower bounds (value >= threshold) -> bisect_right
+_LIQ_THRESH: Final = (5000, 10000, 20000, 50000, 100000)
+_LIQ_MULT: Final = (0.2, 0.4, 0.6, 0.75, 0.9, 1.0)
+_LIQ_LABEL: Final = ("Very Low: ${:,.0f}", "Low: ${:,.0f}", "Adequate: ${:,.0f}",
+              "Good: ${:,.0f}", "Very Good: ${:,.0f}", "Excellent: ${:,.0f}")
+
+_HOLDER_THRESH: Final = (50, 200, 500, 1000)
+_HOLDER_MULT: Final = (0.1, 0.2, 0.3, 0.4, 0.5)
+_HOLDER_LABEL: Final = ("Very Low: {}", "Low: {}", "Moderate: {}", "Good: {}", "Strong: {}")
+
+_VOL_THRESH: Final = (0.1, 0.2, 0.5, 1)
+_VOL_MULT: Final = (0.05, 0.15, 0.25, 0.35, 0.4)
+_VOL_LABEL: Final = ("Very low: ${:,.0f}/h", "Low: ${:,.0f}/h", "Moderate: ${:,.0f}/h",
+              "Good activity: ${:,.0f}/h", "High activity: ${:,.0f}/h")
+
+_BP_THRESH: Final = (0.4, 0.5, 0.6, 0.7)
+_BP_MULT: Final = (0, 0.1, 0.2, 0.3, 0.35)
+_BP_LABEL: Final = ("Heavy selling: {:.0f}%", "Bearish: {:.0f}%", "Balanced: {:.0f}%",
+             "Bullish: {:.0f}%", "Strong buying: {:.0f}%")
+
+_TXN_THRESH: Final = (20, 50, 100)
+_TXN_MULT: Final = (0.05, 0.15, 0.2, 0.25)
+
+# Exclusive lower bounds (value > threshold) -> bisect_left
+_SHORT_THRESH: Final = (-5, 0, 5, 10)
+_SHORT_MULT: Final = (0, 0.1, 0.15, 0.25, 0.3)
+_SHORT_LABEL: Final = ("Dumping: {:.1f}%", "Flat: {:.1f}%", "Slightly up: +{:.1f}%",
+                "Rising: +{:.1f}%", "Strong pump: +{:.1f}%")
+
+_MED_THRESH: Final = (-10, 0, 10, 20)
+_MED_MULT: Final = (0, 0.1, 0.2, 0.3, 0.35)
+
+# Inclusive upper bounds (value <= threshold) -> bisect_left;
+# the last threshold (max top holder) is appended from config
+_DIST_THRESH: Final = (5, 10, 15)
+_DIST_MULT: Final = (0.5, 0.4, 0.25, 0.1, 0)
+_DIST_LABEL: Final = ("Well distributed: {:.1f}%", "Good distribution: {:.1f}%",
+               "Moderate: {:.1f}%", "Concentrated: {:.1f}%")
+
+_TREND: Final = {"INCREASING": (0.35, "Volume increasing"), "STABLE": (0.2, "Volume stable")}
+_TREND_DEFAULT: Final = (0.05, "Volume decreasing")
+
+_GRADE_THRESH: Final = (40, 50, 55, 60, 65, 70, 75, 80, 85, 90)
+_GRADES: Final = ("F", "D", "C-", "C", "C+", "B-", "B", "B+", "A-", "A", "A+")
+
+# Safety status modifier, indexed by SafetyStatus (UNKNOWN, DANGEROUS, WARNING, SAFE)
+_STATUS_MODIFIER: Final = (0, -30, -10, 5)
+
+def _tiered(values: np.ndarray, thresh: Tuple[float, ...], mult: Tuple[float, ...],
+            side: Literal["left", "right"] = "right") -> np.ndarray:
+    """Vectorized bisect: tier multiplier for each value"""
+    return np.asarray(mult)[np.searchsorted(thresh, values, side=side)]
+
+@dataclass(slots=True)
 class ScoreBreakdown:
     """Detailed breakdown of quality score"""
     liquidity_score: int = 0
@@ -50,12 +113,14 @@ class ScoringEngine:
     Produces a 0-100 score based on weighted metrics
     """
     
-    def __init__(self):
+    def __init__(self) -> None:
         self.weights = SCORING_WEIGHTS
+        self._dist_thresh: Tuple[float, ...] = _DIST_THRESH + (TRADING_CONFIG.max_top_holder_percent,)
     
     def score(self, pair: TokenPair, safety: SafetyReport,
-              momentum_data: Dict = None, social_data: Dict = None,
-              smart_money_data: Dict = None) -> ScoreBreakdown:
+              momentum_data: Optional[Dict] = None, social_data: Optional[Dict] = None,
+              smart_money_data: Optional[Dict] = None,
+              verbose: bool = False) -> ScoreBreakdown:
         """
         Calculate quality score for a token
         
@@ -65,29 +130,30 @@ class ScoringEngine:
             momentum_data: Optional momentum analysis
             social_data: Optional social signals
             smart_money_data: Optional smart wallet data
+            verbose: Fill details, bonuses and penalties (skipped by default)
         
         Returns:
-            ScoreBreakdown with detailed scoring
+            ScoreBreakdown with sub-scores and total
         """
         breakdown = ScoreBreakdown()
         
         # 1. Liquidity Score (0-20)
-        breakdown.liquidity_score = self._score_liquidity(pair, breakdown)
+        breakdown.liquidity_score = self._score_liquidity(pair, breakdown, verbose)
         
         # 2. Holders Score (0-20)
-        breakdown.holders_score = self._score_holders(pair, safety, breakdown)
+        breakdown.holders_score = self._score_holders(pair, safety, breakdown, verbose)
         
         # 3. Trading Activity Score (0-25)
-        breakdown.trading_score = self._score_trading(pair, breakdown)
+        breakdown.trading_score = self._score_trading(pair, breakdown, verbose)
         
         # 4. Momentum Score (0-20)
-        breakdown.momentum_score = self._score_momentum(pair, momentum_data, breakdown)
+        breakdown.momentum_score = self._score_momentum(pair, momentum_data, breakdown, verbose)
         
         # 5. Social Score (0-10)
-        breakdown.social_score = self._score_social(social_data, smart_money_data, breakdown)
+        breakdown.social_score = self._score_social(social_data, smart_money_data, breakdown, verbose)
         
         # 6. Dev/Contract Score (0-5)
-        breakdown.dev_score = self._score_dev(safety, breakdown)
+        breakdown.dev_score = self._score_dev(safety, breakdown, verbose)
         
         # Calculate total
         breakdown.total_score = (
@@ -100,88 +166,167 @@ class ScoringEngine:
         )
         
         # Apply bonuses and penalties
-        breakdown.total_score = self._apply_modifiers(pair, safety, breakdown)
+        breakdown.total_score = self._apply_modifiers(pair, safety, breakdown, verbose)
         
         # Clamp to 0-100
         breakdown.total_score = max(0, min(100, breakdown.total_score))
         
         return breakdown
     
-    def _score_liquidity(self, pair: TokenPair, breakdown: ScoreBreakdown) -> int:
+    def score_batch(self, pairs: List[TokenPair], safeties: List[SafetyReport],
+                    smart_money: Optional[List[Dict]] = None,
+                    detail_cutoff: Optional[int] = None) -> List[ScoreBreakdown]:
+        """
+        Score many tokens at once with NumPy
+        
+        Sub-scores and totals match score(); details, bonuses and penalties
+        are left empty except for tokens whose total reaches detail_cutoff,
+        which are re-scored with score() to fill them in.
+        
+        Args:
+            pairs: Token pairs from DEXScreener
+            safeties: Safety reports, parallel to pairs
+            smart_money: Optional smart wallet data, parallel to pairs
+            detail_cutoff: Minimum total score for a full breakdown
+        
+        Returns:
+            List of ScoreBreakdown, parallel to pairs
+        """
+        n = len(pairs)
+        if n == 0:
+            return []
+        w = self.weights
+        
+        def column(values: Iterable[float]) -> np.ndarray:
+            return np.fromiter(values, dtype=np.float64, count=n)
+        
+        liq = column(p.liquidity_usd for p in pairs)
+        vol_1h = column(p.volume_1h for p in pairs)
+        vol_6h = column(p.volume_6h for p in pairs)
+        vol_24h = column(p.volume_24h for p in pairs)
+        buys_1h = column(p.txns_buys_1h for p in pairs)
+        sells_1h = column(p.txns_sells_1h for p in pairs)
+        change_5m = column(p.price_change_5m for p in pairs)
+        change_1h = column(p.price_change_1h for p in pairs)
+        market_cap = column(p.market_cap for p in pairs)
+        age = column(p.age_minutes for p in pairs)
+        holders = column(s.holder_count for s in safeties)
+        top_percent = column(s.top_holder_percent for s in safeties)
+        
+        # 1. Liquidity
+        liq_score = (w.liquidity * _tiered(liq, _LIQ_THRESH, _LIQ_MULT)).astype(np.int64)
+        liq_score[liq < TRADING_CONFIG.min_liquidity_usd] = 0
+        
+        # 2. Holders
+        holders_score = (w.holders * _tiered(holders, _HOLDER_THRESH, _HOLDER_MULT) +
+                         w.holders * _tiered(top_percent, self._dist_thresh, _DIST_MULT, "left")
+                         ).astype(np.int64)
+        
+        # 3. Trading activity
+        vol_liq_ratio = np.divide(vol_24h, liq, out=np.zeros(n), where=liq > 0)
+        txn_count = buys_1h + sells_1h
+        buy_pressure = np.divide(buys_1h, txn_count, out=np.full(n, 0.5), where=txn_count > 0)
+        trading_score = (w.trading_activity * _tiered(vol_liq_ratio, _VOL_THRESH, _VOL_MULT) +
+                         w.trading_activity * _tiered(buy_pressure, _BP_THRESH, _BP_MULT) +
+                         w.trading_activity * _tiered(txn_count, _TXN_THRESH, _TXN_MULT)
+                         ).astype(np.int64)
+        
+        # 4. Momentum
+        trend_mult = np.where(vol_1h > vol_6h / 6 * 2, _TREND["INCREASING"][0],
+                              np.where(vol_1h < vol_6h / 6 * 0.5, _TREND_DEFAULT[0],
+                                       _TREND["STABLE"][0]))
+        momentum_score = (w.momentum * _tiered(change_5m, _SHORT_THRESH, _SHORT_MULT, "left") +
+                          w.momentum * _tiered(change_1h, _MED_THRESH, _MED_MULT, "left") +
+                          w.momentum * trend_mult).astype(np.int64)
+        
+        # 5. Social (smart money only)
+        if smart_money:
+            buying = column((sm or {}).get("smart_wallets_buying", 0) for sm in smart_money)
+            social = np.where(buying >= 3, w.social_signals * 0.5,
+                              np.where(buying >= 1, w.social_signals * 0.3, 0.0))
+            social_score = np.minimum(social, w.social_signals).astype(np.int64)
+        else:
+            social_score = np.zeros(n, dtype=np.int64)
+        
+        # 6. Dev/contract
+        has_mint = np.fromiter((s.has_mint for s in safeties), dtype=bool, count=n)
+        is_proxy = np.fromiter((s.is_proxy for s in safeties), dtype=bool, count=n)
+        lp_locked = np.fromiter((s.lp_locked for s in safeties), dtype=bool, count=n)
+        renounced = np.fromiter((s.is_renounced for s in safeties), dtype=bool, count=n)
+        dev_score = np.maximum(0, w.dev_reputation - 2 * has_mint - 2 * is_proxy
+                               - ~lp_locked - ~renounced)
+        
+        # Modifiers
+        total = liq_score + holders_score + trading_score + momentum_score + social_score + dev_score
+        total += np.where(age < 10, 5, np.where(age < 30, 3, np.where(age > 180, -5, 0)))
+        total += np.where(market_cap <= 0, 0,
+                          np.where(market_cap < 50000, 3, np.where(market_cap > 10000000, -5, 0)))
+        total += np.fromiter((_STATUS_MODIFIER[s.status] for s in safeties),
+                             dtype=np.int64, count=n)
+        total = np.clip(total, 0, 100)
+        
+        results = []
+        columns = zip(liq_score.tolist(), holders_score.tolist(), trading_score.tolist(),
+                      momentum_score.tolist(), social_score.tolist(), dev_score.tolist(),
+                      total.tolist())
+        for i, (liq_s, hold_s, trade_s, mom_s, soc_s, dev_s, tot) in enumerate(columns):
+            if detail_cutoff is not None and tot >= detail_cutoff:
+                results.append(self.score(pairs[i], safeties[i], None, None,
+                                          smart_money[i] if smart_money else None,
+                                          verbose=True))
+                continue
+            results.append(ScoreBreakdown(
+                liquidity_score=liq_s, holders_score=hold_s, trading_score=trade_s,
+                momentum_score=mom_s, social_score=soc_s, dev_score=dev_s,
+                total_score=tot
+            ))
+        return results
+    
+    def _score_liquidity(self, pair: TokenPair, breakdown: ScoreBreakdown,
+                         verbose: bool) -> int:
         """Score liquidity (0-20)"""
         liq = pair.liquidity_usd
         max_score = self.weights.liquidity
         
         if liq < TRADING_CONFIG.min_liquidity_usd:
-            breakdown.details["liquidity"] = f"Below minimum: ${liq:,.0f}"
+            if verbose:
+                breakdown.details["liquidity"] = f"Below minimum: ${liq:,.0f}"
             return 0
         
         # Scoring tiers
-        if liq >= 100000:
-            score = max_score
-            breakdown.details["liquidity"] = f"Excellent: ${liq:,.0f}"
-        elif liq >= 50000:
-            score = int(max_score * 0.9)
-            breakdown.details["liquidity"] = f"Very Good: ${liq:,.0f}"
-        elif liq >= 20000:
-            score = int(max_score * 0.75)
-            breakdown.details["liquidity"] = f"Good: ${liq:,.0f}"
-        elif liq >= 10000:
-            score = int(max_score * 0.6)
-            breakdown.details["liquidity"] = f"Adequate: ${liq:,.0f}"
-        elif liq >= 5000:
-            score = int(max_score * 0.4)
-            breakdown.details["liquidity"] = f"Low: ${liq:,.0f}"
-        else:
-            score = int(max_score * 0.2)
-            breakdown.details["liquidity"] = f"Very Low: ${liq:,.0f}"
+        tier = bisect_right(_LIQ_THRESH, liq)
+        score = int(max_score * _LIQ_MULT[tier])
+        if verbose:
+            breakdown.details["liquidity"] = _LIQ_LABEL[tier].format(liq)
         
         return score
     
     def _score_holders(self, pair: TokenPair, safety: SafetyReport,
-                      breakdown: ScoreBreakdown) -> int:
+                      breakdown: ScoreBreakdown, verbose: bool) -> int:
         """Score holder distribution (0-20)"""
         max_score = self.weights.holders
         holders = safety.holder_count
         top_percent = safety.top_holder_percent
         
         # Holder count scoring
-        if holders >= 1000:
-            holder_score = max_score * 0.5
-            breakdown.details["holder_count"] = f"Strong: {holders}"
-        elif holders >= 500:
-            holder_score = max_score * 0.4
-            breakdown.details["holder_count"] = f"Good: {holders}"
-        elif holders >= 200:
-            holder_score = max_score * 0.3
-            breakdown.details["holder_count"] = f"Moderate: {holders}"
-        elif holders >= 50:
-            holder_score = max_score * 0.2
-            breakdown.details["holder_count"] = f"Low: {holders}"
-        else:
-            holder_score = max_score * 0.1
-            breakdown.details["holder_count"] = f"Very Low: {holders}"
+        tier = bisect_right(_HOLDER_THRESH, holders)
+        holder_score = max_score * _HOLDER_MULT[tier]
+        if verbose:
+            breakdown.details["holder_count"] = _HOLDER_LABEL[tier].format(holders)
         
         # Distribution scoring
-        if top_percent <= 5:
-            dist_score = max_score * 0.5
-            breakdown.details["distribution"] = f"Well distributed: {top_percent:.1f}%"
-        elif top_percent <= 10:
-            dist_score = max_score * 0.4
-            breakdown.details["distribution"] = f"Good distribution: {top_percent:.1f}%"
-        elif top_percent <= 15:
-            dist_score = max_score * 0.25
-            breakdown.details["distribution"] = f"Moderate: {top_percent:.1f}%"
-        elif top_percent <= TRADING_CONFIG.max_top_holder_percent:
-            dist_score = max_score * 0.1
-            breakdown.details["distribution"] = f"Concentrated: {top_percent:.1f}%"
-        else:
-            dist_score = 0
-            breakdown.penalties.append(f"Too concentrated: {top_percent:.1f}%")
+        tier = bisect_left(self._dist_thresh, top_percent)
+        dist_score = max_score * _DIST_MULT[tier]
+        if verbose:
+            if tier < len(_DIST_LABEL):
+                breakdown.details["distribution"] = _DIST_LABEL[tier].format(top_percent)
+            else:
+                breakdown.penalties.append(f"Too concentrated: {top_percent:.1f}%")
         
         return int(holder_score + dist_score)
     
-    def _score_trading(self, pair: TokenPair, breakdown: ScoreBreakdown) -> int:
+    def _score_trading(self, pair: TokenPair, breakdown: ScoreBreakdown,
+                       verbose: bool) -> int:
         """Score trading activity (0-25)"""
         max_score = self.weights.trading_activity
         
@@ -192,58 +337,31 @@ class ScoringEngine:
         # Volume to liquidity ratio (healthy = 0.5-2x daily)
         vol_liq_ratio = vol_24h / pair.liquidity_usd if pair.liquidity_usd > 0 else 0
         
-        if vol_liq_ratio >= 1:
-            vol_score = max_score * 0.4
-            breakdown.details["volume"] = f"High activity: ${vol_1h:,.0f}/h"
-        elif vol_liq_ratio >= 0.5:
-            vol_score = max_score * 0.35
-            breakdown.details["volume"] = f"Good activity: ${vol_1h:,.0f}/h"
-        elif vol_liq_ratio >= 0.2:
-            vol_score = max_score * 0.25
-            breakdown.details["volume"] = f"Moderate: ${vol_1h:,.0f}/h"
-        elif vol_liq_ratio >= 0.1:
-            vol_score = max_score * 0.15
-            breakdown.details["volume"] = f"Low: ${vol_1h:,.0f}/h"
-        else:
-            vol_score = max_score * 0.05
-            breakdown.details["volume"] = f"Very low: ${vol_1h:,.0f}/h"
+        tier = bisect_right(_VOL_THRESH, vol_liq_ratio)
+        vol_score = max_score * _VOL_MULT[tier]
+        if verbose:
+            breakdown.details["volume"] = _VOL_LABEL[tier].format(vol_1h)
         
         # Buy pressure analysis
         buy_pressure = pair.buy_pressure_1h
         
-        if buy_pressure >= 0.7:
-            bp_score = max_score * 0.35
-            breakdown.details["buy_pressure"] = f"Strong buying: {buy_pressure*100:.0f}%"
-            breakdown.bonuses.append("Strong buy pressure")
-        elif buy_pressure >= 0.6:
-            bp_score = max_score * 0.3
-            breakdown.details["buy_pressure"] = f"Bullish: {buy_pressure*100:.0f}%"
-        elif buy_pressure >= 0.5:
-            bp_score = max_score * 0.2
-            breakdown.details["buy_pressure"] = f"Balanced: {buy_pressure*100:.0f}%"
-        elif buy_pressure >= 0.4:
-            bp_score = max_score * 0.1
-            breakdown.details["buy_pressure"] = f"Bearish: {buy_pressure*100:.0f}%"
-        else:
-            bp_score = 0
-            breakdown.details["buy_pressure"] = f"Heavy selling: {buy_pressure*100:.0f}%"
-            breakdown.penalties.append("Heavy sell pressure")
+        tier = bisect_right(_BP_THRESH, buy_pressure)
+        bp_score = max_score * _BP_MULT[tier]
+        if verbose:
+            breakdown.details["buy_pressure"] = _BP_LABEL[tier].format(buy_pressure * 100)
+            if tier == len(_BP_THRESH):
+                breakdown.bonuses.append("Strong buy pressure")
+            elif tier == 0:
+                breakdown.penalties.append("Heavy sell pressure")
         
         # Transaction count
         txn_count = pair.txns_buys_1h + pair.txns_sells_1h
-        if txn_count >= 100:
-            txn_score = max_score * 0.25
-        elif txn_count >= 50:
-            txn_score = max_score * 0.2
-        elif txn_count >= 20:
-            txn_score = max_score * 0.15
-        else:
-            txn_score = max_score * 0.05
+        txn_score = max_score * _TXN_MULT[bisect_right(_TXN_THRESH, txn_count)]
         
         return int(vol_score + bp_score + txn_score)
     
-    def _score_momentum(self, pair: TokenPair, momentum_data: Dict,
-                       breakdown: ScoreBreakdown) -> int:
+    def _score_momentum(self, pair: TokenPair, momentum_data: Optional[Dict],
+                       breakdown: ScoreBreakdown, verbose: bool) -> int:
         """Score momentum indicators (0-20)"""
         max_score = self.weights.momentum
         
@@ -252,65 +370,45 @@ class ScoringEngine:
         change_1h = pair.price_change_1h
         
         # Short-term momentum
-        if change_5m > 10:
-            short_score = max_score * 0.3
-            breakdown.details["short_momentum"] = f"Strong pump: +{change_5m:.1f}%"
-        elif change_5m > 5:
-            short_score = max_score * 0.25
-            breakdown.details["short_momentum"] = f"Rising: +{change_5m:.1f}%"
-        elif change_5m > 0:
-            short_score = max_score * 0.15
-            breakdown.details["short_momentum"] = f"Slightly up: +{change_5m:.1f}%"
-        elif change_5m > -5:
-            short_score = max_score * 0.1
-            breakdown.details["short_momentum"] = f"Flat: {change_5m:.1f}%"
-        else:
-            short_score = 0
-            breakdown.details["short_momentum"] = f"Dumping: {change_5m:.1f}%"
+        tier = bisect_left(_SHORT_THRESH, change_5m)
+        short_score = max_score * _SHORT_MULT[tier]
+        if verbose:
+            breakdown.details["short_momentum"] = _SHORT_LABEL[tier].format(change_5m)
         
         # Medium-term momentum
-        if change_1h > 20:
-            med_score = max_score * 0.35
-            breakdown.bonuses.append(f"Strong 1h momentum: +{change_1h:.1f}%")
-        elif change_1h > 10:
-            med_score = max_score * 0.3
-        elif change_1h > 0:
-            med_score = max_score * 0.2
-        elif change_1h > -10:
-            med_score = max_score * 0.1
-        else:
-            med_score = 0
-            breakdown.penalties.append(f"Weak 1h: {change_1h:.1f}%")
+        tier = bisect_left(_MED_THRESH, change_1h)
+        med_score = max_score * _MED_MULT[tier]
+        if verbose:
+            if tier == len(_MED_THRESH):
+                breakdown.bonuses.append(f"Strong 1h momentum: +{change_1h:.1f}%")
+            elif tier == 0:
+                breakdown.penalties.append(f"Weak 1h: {change_1h:.1f}%")
         
         # Volume trend
-        vol_trend = pair.volume_trend
-        if vol_trend == "INCREASING":
-            trend_score = max_score * 0.35
-            breakdown.details["volume_trend"] = "Volume increasing"
-        elif vol_trend == "STABLE":
-            trend_score = max_score * 0.2
-            breakdown.details["volume_trend"] = "Volume stable"
-        else:
-            trend_score = max_score * 0.05
-            breakdown.details["volume_trend"] = "Volume decreasing"
+        trend_mult, trend_label = _TREND.get(pair.volume_trend, _TREND_DEFAULT)
+        trend_score = max_score * trend_mult
+        if verbose:
+            breakdown.details["volume_trend"] = trend_label
         
         return int(short_score + med_score + trend_score)
     
-    def _score_social(self, social_data: Dict, smart_money_data: Dict,
-                     breakdown: ScoreBreakdown) -> int:
+    def _score_social(self, social_data: Optional[Dict], smart_money_data: Optional[Dict],
+                     breakdown: ScoreBreakdown, verbose: bool) -> int:
         """Score social and smart money signals (0-10)"""
         max_score = self.weights.social_signals
-        score = 0
+        score: float = 0
         
         # Smart money signals
         if smart_money_data:
             buying = smart_money_data.get("smart_wallets_buying", 0)
             if buying >= 3:
                 score += max_score * 0.5
-                breakdown.bonuses.append(f"{buying} smart wallets buying")
+                if verbose:
+                    breakdown.bonuses.append(f"{buying} smart wallets buying")
             elif buying >= 1:
                 score += max_score * 0.3
-                breakdown.details["smart_money"] = f"{buying} smart wallet(s)"
+                if verbose:
+                    breakdown.details["smart_money"] = f"{buying} smart wallet(s)"
         
         # Social signals (if available)
         if social_data:
@@ -319,13 +417,15 @@ class ScoringEngine:
             
             if mentions > 100:
                 score += max_score * 0.3
-                breakdown.details["social"] = f"Trending: {mentions} mentions"
+                if verbose:
+                    breakdown.details["social"] = f"Trending: {mentions} mentions"
             elif mentions > 20:
                 score += max_score * 0.15
         
         return int(min(score, max_score))
     
-    def _score_dev(self, safety: SafetyReport, breakdown: ScoreBreakdown) -> int:
+    def _score_dev(self, safety: SafetyReport, breakdown: ScoreBreakdown,
+                   verbose: bool) -> int:
         """Score developer/contract quality (0-5)"""
         max_score = self.weights.dev_reputation
         score = max_score  # Start with full score
@@ -341,13 +441,13 @@ class ScoringEngine:
             score -= 1
         
         # Bonus for clean contract
-        if safety.is_renounced and safety.lp_locked and not safety.has_mint:
+        if verbose and safety.is_renounced and safety.lp_locked and not safety.has_mint:
             breakdown.bonuses.append("Clean contract")
         
         return max(0, score)
     
     def _apply_modifiers(self, pair: TokenPair, safety: SafetyReport,
-                        breakdown: ScoreBreakdown) -> int:
+                        breakdown: ScoreBreakdown, verbose: bool) -> int:
         """Apply bonus and penalty modifiers"""
         score = breakdown.total_score
         
@@ -355,53 +455,38 @@ class ScoringEngine:
         age = pair.age_minutes
         if age < 10:
             score += 5
-            breakdown.bonuses.append("Very fresh token")
+            if verbose:
+                breakdown.bonuses.append("Very fresh token")
         elif age < 30:
             score += 3
-            breakdown.bonuses.append("Fresh token")
+            if verbose:
+                breakdown.bonuses.append("Fresh token")
         elif age > 180:
             score -= 5
-            breakdown.penalties.append("Token getting old")
+            if verbose:
+                breakdown.penalties.append("Token getting old")
         
         # Market cap consideration
         if pair.market_cap > 0:
             if pair.market_cap < 50000:
                 score += 3
-                breakdown.bonuses.append("Micro cap opportunity")
+                if verbose:
+                    breakdown.bonuses.append("Micro cap opportunity")
             elif pair.market_cap > 10000000:
                 score -= 5
-                breakdown.penalties.append("High cap, limited upside")
+                if verbose:
+                    breakdown.penalties.append("High cap, limited upside")
         
         # Safety status modifier
-        if safety.status == SafetyStatus.SAFE:
-            score += 5
-        elif safety.status == SafetyStatus.WARNING:
-            score -= 10
-        elif safety.status == SafetyStatus.DANGEROUS:
-            score -= 30
+        score += _STATUS_MODIFIER[safety.status]
         
         return score
     
     def get_grade(self, score: int) -> str:
         """Convert score to letter grade"""
-        if score >= 90: return "A+"
-        if score >= 85: return "A"
-        if score >= 80: return "A-"
-        if score >= 75: return "B+"
-        if score >= 70: return "B"
-        if score >= 65: return "B-"
-        if score >= 60: return "C+"
-        if score >= 55: return "C"
-        if score >= 50: return "C-"
-        if score >= 40: return "D"
-        return "F"
-
-
-# Singleton
-_scoring_engine: Optional[ScoringEngine] = None
+        return _GRADES[bisect_right(_GRADE_THRESH, score)]
 
+# Singleton (memoized getter)
+@cache
 def get_scoring_engine() -> ScoringEngine:
-    global _scoring_engine
-    if _scoring_engine is None:
-        _scoring_engine = ScoringEngine()
-    return _scoring_engine
+    return ScoringEngine()
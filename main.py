@@ -4,12 +4,15 @@ Complete bot coordination and lifecycle management
 """
 
 import asyncio
+import queue
 import signal
 import sys
 import os
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, cast
 import logging
+import logging.handlers
 
 # Add project to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -22,29 +25,42 @@ from core.rpc_manager import get_rpc_manager, shutdown_rpc_manager
 from core.database import get_database, shutdown_database, DailyStats
 from scanners.dexscreener import get_dexscreener, shutdown_dexscreener, TokenPair
 from scanners.wallet_tracker import get_wallet_tracker, shutdown_wallet_tracker
-from engines.safety_engine import get_safety_engine, shutdown_safety_engine, SafetyStatus
+from engines.safety_engine import get_safety_engine, shutdown_safety_engine, SafetyEngine, SafetyStatus
 from engines.scoring_engine import get_scoring_engine
 from engines.momentum_engine import get_momentum_engine
 from engines.confluence_engine import get_confluence_engine
 from engines.execution_engine import get_execution_engine, shutdown_execution_engine
 from engines.position_manager import get_position_manager, shutdown_position_manager
 from utils.telegram_logger import get_telegram_logger, shutdown_telegram_logger
+from utils.http import shutdown_http_session
 
 # Setup logging
-def setup_logging():
+def setup_logging() -> logging.handlers.QueueListener:
+    """Log through a queue so console/file writes happen off the event loop"""
     os.makedirs("logs", exist_ok=True)
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler('logs/bot.log')
-        ]
-    )
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers: List[logging.Handler] = [logging.StreamHandler(), logging.FileHandler('logs/bot.log')]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))  # full format applied by listener
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    listener.start()
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+    return listener
 
 logger = logging.getLogger(__name__)
 
 
+class RejectReason:
+    """Quick-filter rejection keys, counted in stats without parsing the reason text"""
+    LOW_LIQUIDITY = "Low liquidity"
+    TOO_OLD = "Too old"
+    HEAVY_SELLING = "Heavy selling"
+
+
 class MoonshotBot:
     """
     Main bot orchestrator
@@ -71,18 +87,20 @@ class MoonshotBot:
         self.telegram = None
         
         # Statistics
-        self.stats = {
+        self.stats: Dict[str, Any] = {
             "tokens_scanned": 0,
             "tokens_analyzed": 0,
             "entries": 0,
             "rejections": 0,
-            "rejections_by_reason": {},
+            "rejections_by_reason": Counter(),
             "start_time": None
         }
         
         # Control
         self.running = False
         self.shutdown_event = asyncio.Event()
+        self.loop: Optional[asyncio.AbstractEventLoop] = None  # set in start()
+        self.analyze_semaphore = asyncio.Semaphore(4)  # concurrent token analyses
         
         logger.info(f"MoonshotBot initialized in {self.mode.value} mode")
         logger.info(f"Active chains: {[c.value for c in self.active_chains]}")
@@ -90,6 +108,7 @@ class MoonshotBot:
     async def start(self):
         """Start all bot components"""
         logger.info("Starting Moonshot Sniper Bot...")
+        self.loop = asyncio.get_running_loop()
         
         # Initialize all components
         self.rpc = get_rpc_manager(self.wallets)
@@ -127,6 +146,10 @@ class MoonshotBot:
         
         logger.info("All components started successfully!")
         
+        # Run tasks eagerly so awaits that complete immediately skip a loop pass (3.12+)
+        if hasattr(asyncio, "eager_task_factory"):
+            self.loop.set_task_factory(asyncio.eager_task_factory)
+        
         # Start main loops
         await asyncio.gather(
             self._scan_loop(),
@@ -151,6 +174,7 @@ class MoonshotBot:
         await shutdown_wallet_tracker()
         await shutdown_safety_engine()
         await shutdown_dexscreener()
+        await shutdown_http_session()
         await shutdown_rpc_manager()
         await shutdown_database()
         
@@ -166,15 +190,17 @@ class MoonshotBot:
         
         while self.running:
             try:
-                for chain in self.active_chains:
-                    await self._scan_chain(chain)
+                await asyncio.gather(
+                    *(self._scan_chain(chain) for chain in self.active_chains),
+                    return_exceptions=True
+                )
                 
                 await asyncio.sleep(TRADING_CONFIG.scan_interval_seconds)
                 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"Scan loop error: {e}")
+                logger.error("Scan loop error: %s", e)
                 await self.telegram.log_error(str(e), "Scan Loop")
                 await asyncio.sleep(5)
     
@@ -188,31 +214,62 @@ class MoonshotBot:
                 max_age_minutes=60
             )
             
-            for chain, pair in new_tokens[:10]:  # Limit per cycle
-                self.stats["tokens_scanned"] += 1
-                await self._analyze_token(chain, pair)
-                await asyncio.sleep(0.5)  # Rate limiting
+            # Quick filters run once here; analysis reuses the result
+            candidates = [(pair_chain, pair, self._quick_filter(pair_chain, pair))
+                          for pair_chain, pair in new_tokens[:10]]  # Limit per cycle
+            
+            # Warm the safety cache for likely survivors in one batched lookup
+            addresses = [pair.base_token_address for _, pair, reasons in candidates
+                         if not reasons]
+            if addresses:
+                safety_engine = cast(SafetyEngine, self.safety_engine)  # set in start()
+                await safety_engine.batch_analyze(chain, addresses)
+            
+            await asyncio.gather(*(
+                self._analyze_token_limited(pair_chain, pair, reasons)
+                for pair_chain, pair, reasons in candidates
+            ))
                 
         except Exception as e:
-            logger.error(f"Chain scan error ({chain.value}): {e}")
+            logger.error("Chain scan error (%s): %s", chain.value, e)
     
-    async def _analyze_token(self, chain: Chain, pair: TokenPair):
-        """Full analysis pipeline for a token"""
-        self.stats["tokens_analyzed"] += 1
+    async def _analyze_token_limited(self, chain: Chain, pair: TokenPair,
+                                     rejection_reasons: List[Tuple[str, str]]):
+        """Analyze a token while holding one of the shared analysis slots"""
+        async with self.analyze_semaphore:
+            self.stats["tokens_scanned"] += 1
+            try:
+                await self._analyze_token(chain, pair, rejection_reasons)
+            except Exception as e:
+                logger.error("Token analysis error (%s): %s", pair.base_token_symbol, e)
+    
+    def _quick_filter(self, chain: Chain, pair: TokenPair) -> List[Tuple[str, str]]:
+        """Cheap market-data filters, run before any API lookups; returns (key, text) reasons"""
         rejection_reasons = []
-        
-        # Quick filters
         config = CHAIN_CONFIGS[chain]
         
         if pair.liquidity_usd < config.min_liquidity:
-            rejection_reasons.append(f"Low liquidity: ${pair.liquidity_usd:,.0f}")
+            rejection_reasons.append((RejectReason.LOW_LIQUIDITY,
+                f"{RejectReason.LOW_LIQUIDITY}: ${pair.liquidity_usd:,.0f}"))
         
         if pair.age_minutes > 240:
-            rejection_reasons.append(f"Too old: {pair.age_minutes:.0f}m")
+            rejection_reasons.append((RejectReason.TOO_OLD,
+                f"{RejectReason.TOO_OLD}: {pair.age_minutes:.0f}m"))
         
         if pair.buy_pressure_5m < 0.35:
-            rejection_reasons.append(f"Heavy selling: {pair.buy_pressure_5m*100:.0f}%")
+            rejection_reasons.append((RejectReason.HEAVY_SELLING,
+                f"{RejectReason.HEAVY_SELLING}: {pair.buy_pressure_5m*100:.0f}%"))
         
+        return rejection_reasons
+    
+    async def _analyze_token(self, chain: Chain, pair: TokenPair,
+                             rejection_reasons: Optional[List[Tuple[str, str]]] = None):
+        """Full analysis pipeline for a token; pass quick-filter reasons if already computed"""
+        self.stats["tokens_analyzed"] += 1
+        
+        # Quick filters
+        if rejection_reasons is None:
+            rejection_reasons = self._quick_filter(chain, pair)
         if rejection_reasons:
             await self._reject_token(pair, chain, None, 0, rejection_reasons)
             return
@@ -221,7 +278,7 @@ class MoonshotBot:
         safety = await self.safety_engine.analyze(chain, pair.base_token_address)
         
         if safety.status == SafetyStatus.DANGEROUS:
-            reasons = self.safety_engine.get_rejection_reasons(safety)
+            reasons = self._keyed(self.safety_engine.get_rejection_reasons(safety))
             await self._reject_token(pair, chain, safety, safety.score, reasons)
             return
         
@@ -245,21 +302,22 @@ class MoonshotBot:
         else:
             await self._reject_token(
                 pair, chain, safety, score.total_score,
-                confluence.rejection_reasons
+                self._keyed(confluence.rejection_reasons)
             )
     
     async def _reject_token(self, pair: TokenPair, chain: Chain,
-                           safety: Optional[any], score: int, reasons: List[str]):
-        """Log token rejection"""
+                           safety: Optional[any], score: int, reasons: List[Tuple[str, str]]):
+        """Log token rejection; reasons are (key, text) pairs"""
         self.stats["rejections"] += 1
+        self.stats["rejections_by_reason"].update(key for key, _ in reasons)
         
-        # Track reasons
-        for reason in reasons:
-            key = reason.split(":")[0].strip()
-            self.stats["rejections_by_reason"][key] = \
-                self.stats["rejections_by_reason"].get(key, 0) + 1
-        
-        await self.telegram.log_rejection(pair, chain, safety, score, reasons)
+        await self.telegram.log_rejection(pair, chain, safety, score,
+                                          [text for _, text in reasons])
+    
+    @staticmethod
+    def _keyed(reasons: List[str]) -> List[Tuple[str, str]]:
+        """Key plain-text reasons from other engines by the text before the first ':'"""
+        return [(reason.partition(":")[0].strip(), reason) for reason in reasons]
     
     async def _enter_position(self, chain: Chain, pair: TokenPair,
                              safety, score, confluence):
@@ -304,7 +362,7 @@ class MoonshotBot:
                 mode=self.mode
             )
             
-            logger.info(f"Entered {pool}: {pair.base_token_symbol} @ ${pair.price_usd:.10f}")
+            logger.info("Entered %s: %s @ $%.10f", pool, pair.base_token_symbol, pair.price_usd)
     
     # ============================================================
     # POSITION MONITORING LOOP
@@ -322,7 +380,7 @@ class MoonshotBot:
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"Position loop error: {e}")
+                logger.error("Position loop error: %s", e)
                 await asyncio.sleep(5)
     
     # ============================================================
@@ -332,24 +390,38 @@ class MoonshotBot:
     async def _daily_loop(self):
         """Daily statistics and summary loop"""
         logger.info("Starting daily loop...")
+        last_run: Optional[datetime] = None  # midnight the daily job last ran for
         
         while self.running:
             try:
                 now = datetime.utcnow()
+                next_midnight = now.replace(hour=0, minute=0, second=0,
+                                            microsecond=0) + timedelta(days=1)
                 
-                # Check if midnight UTC
-                if now.hour == 0 and now.minute == 0:
-                    await self._save_daily_stats()
-                    await self._log_daily_summary()
-                    
-                    # Reset daily stats
-                    self.position_manager.daily_pnl = 0
-                    self.position_manager.daily_trades = 0
-                    self.stats["tokens_scanned"] = 0
-                    self.stats["tokens_analyzed"] = 0
-                    self.stats["rejections_by_reason"] = {}
+                # Sleep until midnight UTC, waking early on shutdown
+                try:
+                    await asyncio.wait_for(self.shutdown_event.wait(),
+                                           (next_midnight - now).total_seconds())
+                    break
+                except asyncio.TimeoutError:
+                    pass
                 
-                await asyncio.sleep(60)
+                # wait_for runs on the monotonic clock; recheck wall time so drift or
+                # an NTP step can't run the job early and then again after midnight
+                if datetime.utcnow() < next_midnight or last_run == next_midnight:
+                    continue
+                last_run = next_midnight
+                
+                trades = await self.db.get_today_trades()
+                await self._save_daily_stats(trades)
+                await self._log_daily_summary(trades)
+                
+                # Reset daily stats
+                self.position_manager.daily_pnl = 0
+                self.position_manager.daily_trades = 0
+                self.stats["tokens_scanned"] = 0
+                self.stats["tokens_analyzed"] = 0
+                self.stats["rejections_by_reason"] = Counter()
                 
             except asyncio.CancelledError:
                 break
@@ -357,15 +429,22 @@ class MoonshotBot:
                 logger.error(f"Daily loop error: {e}")
                 await asyncio.sleep(60)
     
-    async def _save_daily_stats(self):
+    @staticmethod
+    def _count_outcomes(trades: List) -> tuple:
+        """(winners, losers): take-profit vs stop-loss exits"""
+        winners = sum(1 for t in trades if t.trade_type.startswith("TP"))
+        losers = sum(1 for t in trades if "STOP" in t.trade_type)
+        return winners, losers
+    
+    async def _save_daily_stats(self, trades=None):
         """Save daily statistics to database"""
         pm = self.position_manager
         today = datetime.utcnow().strftime("%Y-%m-%d")
         
         # Get trade counts
-        trades = await self.db.get_today_trades()
-        winners = len([t for t in trades if t.trade_type in ["TP1", "TP2", "TP3", "TP4"]])
-        losers = len([t for t in trades if t.trade_type in ["STOP_LOSS", "TRAILING_STOP"]])
+        if trades is None:
+            trades = await self.db.get_today_trades()
+        winners, losers = self._count_outcomes(trades)
         
         stats = DailyStats(
             date=today,
@@ -385,14 +464,14 @@ class MoonshotBot:
         
         await self.db.save_daily_stats(stats)
     
-    async def _log_daily_summary(self):
+    async def _log_daily_summary(self, trades=None):
         """Log daily summary to Telegram"""
         pm = self.position_manager
         today = datetime.utcnow().strftime("%B %d, %Y")
         
-        trades = await self.db.get_today_trades()
-        winners = len([t for t in trades if t.trade_type.startswith("TP")])
-        losers = len([t for t in trades if "STOP" in t.trade_type])
+        if trades is None:
+            trades = await self.db.get_today_trades()
+        winners, losers = self._count_outcomes(trades)
         
         await self.telegram.log_daily_summary(
             date=today,
@@ -434,7 +513,7 @@ class MoonshotBot:
 
 async def main():
     """Main entry point"""
-    setup_logging()
+    log_listener = setup_logging()
     
     # Load configuration
     config = load_config_from_env()
@@ -447,8 +526,8 @@ async def main():
     # Create bot
     bot = MoonshotBot(config)
     
-    # Setup signal handlers
-    loop = asyncio.get_event_loop()
+    # Setup signal handlers on the running loop
+    loop = asyncio.get_running_loop()
     
     def signal_handler():
         logger.info("Shutdown signal received")
@@ -467,6 +546,7 @@ async def main():
     finally:
         if bot.running:
             await bot.stop()
+        log_listener.stop()  # flushes queued records
 
 
 if __name__ == "__main__":
@@ -481,5 +561,14 @@ if __name__ == "__main__":
     except ImportError:
         pass
     
+    # Use uvloop where available (not supported on Windows)
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        uvloop = None
+    
     # Run bot
-    asyncio.run(main())
+    if uvloop:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
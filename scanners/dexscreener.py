@@ -4,18 +4,27 @@ Token discovery, price data, and market analytics
 """
 
 import asyncio
-import aiohttp
+import httpx
+import orjson
+import sys
 import time
-from typing import Dict, Optional, List, Any
+from collections import OrderedDict
+from typing import Dict, Optional, List, Any, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 import logging
 
+import numpy as np
+from asyncio_throttle import Throttler
+
 from config.settings import Chain, API_CONFIG
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# DEXScreener chain identifiers
+CHAIN_IDS: Dict[Chain, str] = {Chain.SOL: "solana", Chain.BSC: "bsc", Chain.BASE: "base"}
+
+@dataclass(slots=True)
 class TokenPair:
     """Trading pair from DEXScreener"""
     chain_id: str = ""
@@ -45,75 +54,99 @@ class TokenPair:
     txns_sells_1h: int = 0
     txns_buys_24h: int = 0
     txns_sells_24h: int = 0
-    created_at: Optional[datetime] = None
+    created_ts: float = 0  # Unix seconds, 0 if unknown
     pair_url: str = ""
+    # Derived metrics, filled on first access; slots rule out functools.cached_property
+    _buy_pressure_5m: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _buy_pressure_1h: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _volume_trend: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def created_at(self) -> Optional[datetime]:
+        if not self.created_ts: return None
+        return datetime.fromtimestamp(self.created_ts, timezone.utc)
     
     @property
     def age_minutes(self) -> float:
-        if not self.created_at: return float('inf')
-        return (datetime.utcnow() - self.created_at).total_seconds() / 60
+        if not self.created_ts: return float('inf')
+        return (time.time() - self.created_ts) / 60
     
     @property
     def buy_pressure_5m(self) -> float:
-        total = self.txns_buys_5m + self.txns_sells_5m
-        return self.txns_buys_5m / total if total > 0 else 0.5
+        if self._buy_pressure_5m is None:
+            total = self.txns_buys_5m + self.txns_sells_5m
+            self._buy_pressure_5m = self.txns_buys_5m / total if total > 0 else 0.5
+        return self._buy_pressure_5m
     
     @property
     def buy_pressure_1h(self) -> float:
-        total = self.txns_buys_1h + self.txns_sells_1h
-        return self.txns_buys_1h / total if total > 0 else 0.5
+        if self._buy_pressure_1h is None:
+            total = self.txns_buys_1h + self.txns_sells_1h
+            self._buy_pressure_1h = self.txns_buys_1h / total if total > 0 else 0.5
+        return self._buy_pressure_1h
     
     @property
     def volume_trend(self) -> str:
-        """Analyze volume trend"""
-        if self.volume_1h > self.volume_6h / 6 * 2:
-            return "INCREASING"
-        elif self.volume_1h < self.volume_6h / 6 * 0.5:
-            return "DECREASING"
-        return "STABLE"
+        """Analyze volume trend (computed once; pairs are not modified after from_api)"""
+        if self._volume_trend is None:
+            if self.volume_1h > self.volume_6h / 6 * 2:
+                self._volume_trend = "INCREASING"
+            elif self.volume_1h < self.volume_6h / 6 * 0.5:
+                self._volume_trend = "DECREASING"
+            else:
+                self._volume_trend = "STABLE"
+        return self._volume_trend
     
     @classmethod
     def from_api(cls, data: Dict) -> "TokenPair":
-        created_at = None
-        if data.get("pairCreatedAt"):
+        # Hot path: hundreds of pairs per scan, so each nested object is fetched once
+        get = data.get
+        created_ts = 0.0
+        created_ms = get("pairCreatedAt")
+        if created_ms:
             try:
-                created_at = datetime.fromtimestamp(data["pairCreatedAt"] / 1000)
-            except: pass
+                created_ts = float(created_ms) / 1000
+            except (TypeError, ValueError): pass
         
-        volume = data.get("volume", {})
-        price_change = data.get("priceChange", {})
-        txns = data.get("txns", {})
+        base = get("baseToken") or {}
+        quote = get("quoteToken") or {}
+        volume = get("volume") or {}
+        price_change = get("priceChange") or {}
+        txns = get("txns") or {}
+        txns_5m = txns.get("m5") or {}
+        txns_1h = txns.get("h1") or {}
+        txns_24h = txns.get("h24") or {}
         
         return cls(
-            chain_id=data.get("chainId", ""),
-            dex_id=data.get("dexId", ""),
-            pair_address=data.get("pairAddress", ""),
-            base_token_address=data.get("baseToken", {}).get("address", ""),
-            base_token_symbol=data.get("baseToken", {}).get("symbol", ""),
-            base_token_name=data.get("baseToken", {}).get("name", ""),
-            quote_token_address=data.get("quoteToken", {}).get("address", ""),
-            quote_token_symbol=data.get("quoteToken", {}).get("symbol", ""),
-            price_usd=float(data.get("priceUsd", 0) or 0),
-            price_native=float(data.get("priceNative", 0) or 0),
-            liquidity_usd=float(data.get("liquidity", {}).get("usd", 0) or 0),
-            fdv=float(data.get("fdv", 0) or 0),
-            market_cap=float(data.get("marketCap", 0) or 0),
-            volume_24h=float(volume.get("h24", 0) or 0),
-            volume_6h=float(volume.get("h6", 0) or 0),
-            volume_1h=float(volume.get("h1", 0) or 0),
-            volume_5m=float(volume.get("m5", 0) or 0),
-            price_change_5m=float(price_change.get("m5", 0) or 0),
-            price_change_1h=float(price_change.get("h1", 0) or 0),
-            price_change_6h=float(price_change.get("h6", 0) or 0),
-            price_change_24h=float(price_change.get("h24", 0) or 0),
-            txns_buys_5m=int(txns.get("m5", {}).get("buys", 0) or 0),
-            txns_sells_5m=int(txns.get("m5", {}).get("sells", 0) or 0),
-            txns_buys_1h=int(txns.get("h1", {}).get("buys", 0) or 0),
-            txns_sells_1h=int(txns.get("h1", {}).get("sells", 0) or 0),
-            txns_buys_24h=int(txns.get("h24", {}).get("buys", 0) or 0),
-            txns_sells_24h=int(txns.get("h24", {}).get("sells", 0) or 0),
-            created_at=created_at,
-            pair_url=data.get("url", "")
+            chain_id=get("chainId", ""),
+            dex_id=get("dexId", ""),
+            pair_address=get("pairAddress", ""),
+            base_token_address=base.get("address", ""),
+            base_token_symbol=base.get("symbol", ""),
+            base_token_name=base.get("name", ""),
+            quote_token_address=quote.get("address", ""),
+            quote_token_symbol=quote.get("symbol", ""),
+            price_usd=float(get("priceUsd") or 0),
+            price_native=float(get("priceNative") or 0),
+            liquidity_usd=float((get("liquidity") or {}).get("usd") or 0),
+            fdv=float(get("fdv") or 0),
+            market_cap=float(get("marketCap") or 0),
+            volume_24h=float(volume.get("h24") or 0),
+            volume_6h=float(volume.get("h6") or 0),
+            volume_1h=float(volume.get("h1") or 0),
+            volume_5m=float(volume.get("m5") or 0),
+            price_change_5m=float(price_change.get("m5") or 0),
+            price_change_1h=float(price_change.get("h1") or 0),
+            price_change_6h=float(price_change.get("h6") or 0),
+            price_change_24h=float(price_change.get("h24") or 0),
+            txns_buys_5m=int(txns_5m.get("buys") or 0),
+            txns_sells_5m=int(txns_5m.get("sells") or 0),
+            txns_buys_1h=int(txns_1h.get("buys") or 0),
+            txns_sells_1h=int(txns_1h.get("sells") or 0),
+            txns_buys_24h=int(txns_24h.get("buys") or 0),
+            txns_sells_24h=int(txns_24h.get("sells") or 0),
+            created_ts=created_ts,
+            pair_url=get("url", "")
         )
     
     def to_dict(self) -> Dict:
@@ -132,48 +165,83 @@ class TokenPair:
 class DEXScreenerClient:
     """DEXScreener API client for token discovery"""
     
-    CHAIN_MAP = {Chain.SOL: "solana", Chain.BSC: "bsc", Chain.BASE: "base"}
+    CHAIN_MAP = CHAIN_IDS
     
     def __init__(self):
         self.base_url = API_CONFIG.dexscreener_base
         self.rate_limit = API_CONFIG.dexscreener_rate_limit
-        self.session: Optional[aiohttp.ClientSession] = None
-        self.request_times: List[float] = []
-        self.seen_pairs: Dict[str, datetime] = {}
+        self.session: Optional[httpx.AsyncClient] = None
+        # Sliding 60s window shared by every request; blocks only at quota
+        self.throttler = Throttler(rate_limit=self.rate_limit, period=60, retry_interval=0.1)
+        # pair address -> monotonic time first seen, oldest first
+        self.seen_pairs: "OrderedDict[str, float]" = OrderedDict()
+        self.seen_ttl: int = 300
+        self.seen_max_size: int = 5000
+        # endpoint -> (monotonic fetch time, data); short-lived LRU
+        self.response_cache: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self.response_ttl: float = 2.0
+        self.response_max_size: int = 512
+        self._inflight: Dict[str, asyncio.Future] = {}
     
     async def start(self):
-        self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
+        # Single host: HTTP/2 multiplexes concurrent scans over one warm TLS connection
+        self.session = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20,
+                                keepalive_expiry=75),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            headers={"Accept-Encoding": "gzip"}
+        )
     
     async def stop(self):
         if self.session:
-            await self.session.close()
+            await self.session.aclose()
             self.session = None
     
-    def _check_rate_limit(self) -> bool:
-        now = time.time()
-        self.request_times = [t for t in self.request_times if now - t < 60]
-        return len(self.request_times) < self.rate_limit
-    
     async def _request(self, endpoint: str) -> Optional[Dict]:
-        if not self.session: await self.start()
-        if not self._check_rate_limit():
-            await asyncio.sleep(1)
+        """Cached GET; concurrent calls for one endpoint share a single request"""
+        cached = self.response_cache.get(endpoint)
+        if cached and time.monotonic() - cached[0] < self.response_ttl:
+            self.response_cache.move_to_end(endpoint)
+            return cached[1]
+        
+        inflight = self._inflight.get(endpoint)
+        if inflight:
+            return await asyncio.shield(inflight)
         
-        self.request_times.append(time.time())
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[endpoint] = future
+        data = None
+        try:
+            data = await self._fetch(endpoint)
+            if data is not None:
+                self.response_cache[endpoint] = (time.monotonic(), data)
+                self.response_cache.move_to_end(endpoint)
+                while len(self.response_cache) > self.response_max_size:
+                    self.response_cache.popitem(last=False)
+        finally:
+            del self._inflight[endpoint]
+            future.set_result(data)
+        return data
+    
+    async def _fetch(self, endpoint: str) -> Optional[Dict]:
+        if not self.session: await self.start()
+        assert self.session is not None
         url = f"{self.base_url}/{endpoint}"
         
         try:
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    return await response.json()
-                elif response.status == 429:
-                    await asyncio.sleep(5)
+            async with self.throttler:
+                response = await self.session.get(url)
+            if response.status_code == 200:
+                return orjson.loads(response.content)
+            elif response.status_code == 429:
+                await asyncio.sleep(5)
         except Exception as e:
             logger.warning(f"DEXScreener error: {e}")
         return None
     
     async def get_token_pairs(self, chain: Chain, token_address: str) -> List[TokenPair]:
-        chain_id = self.CHAIN_MAP.get(chain)
+        chain_id = CHAIN_IDS.get(chain)
         if not chain_id: return []
         
         data = await self._request(f"dex/tokens/{token_address}")
@@ -188,7 +256,7 @@ class DEXScreenerClient:
         return pairs
     
     async def get_pair(self, chain: Chain, pair_address: str) -> Optional[TokenPair]:
-        chain_id = self.CHAIN_MAP.get(chain)
+        chain_id = CHAIN_IDS.get(chain)
         if not chain_id: return None
         
         data = await self._request(f"dex/pairs/{chain_id}/{pair_address}")
@@ -211,76 +279,121 @@ class DEXScreenerClient:
     
     async def get_new_pairs(self, chain: Chain, max_age_minutes: int = 60) -> List[TokenPair]:
         """Get new pairs created within max_age_minutes"""
-        chain_id = self.CHAIN_MAP.get(chain)
+        chain_id = CHAIN_IDS.get(chain)
         if not chain_id: return []
         
         data = await self._request(f"dex/pairs/{chain_id}")
         if not data or "pairs" not in data: return []
         
+        # Filter on the raw creation time before building any TokenPair
         pairs = []
+        cutoff_ms = (time.time() - max_age_minutes * 60) * 1000
         for pair_data in data["pairs"]:
             try:
-                pair = TokenPair.from_api(pair_data)
-                if pair.age_minutes <= max_age_minutes:
-                    pairs.append(pair)
+                created_ms = float(pair_data.get("pairCreatedAt") or 0)
+                if not created_ms or created_ms < cutoff_ms:
+                    continue
+                pairs.append(TokenPair.from_api(pair_data))
             except: pass
         
-        pairs.sort(key=lambda p: p.created_at or datetime.min, reverse=True)
+        pairs.sort(key=lambda p: p.created_ts, reverse=True)
         return pairs
     
-    async def get_trending(self, chain: Chain, limit: int = 50) -> List[TokenPair]:
-        """Get trending tokens by volume"""
-        chain_id = self.CHAIN_MAP.get(chain)
+    async def _get_raw_pairs(self, chain: Chain) -> List[Dict]:
+        chain_id = CHAIN_IDS.get(chain)
         if not chain_id: return []
         
         data = await self._request(f"dex/pairs/{chain_id}")
         if not data or "pairs" not in data: return []
+        return data["pairs"]
+    
+    @staticmethod
+    def _column(raw: List[Dict], group: str, key: str) -> np.ndarray:
+        """Extract one numeric field (e.g. volume.h1) from raw pairs"""
+        return np.fromiter((float((p.get(group) or {}).get(key, 0) or 0) for p in raw),
+                           dtype=np.float64, count=len(raw))
+    
+    @staticmethod
+    def _top_k(values: np.ndarray, candidates: np.ndarray, k: int) -> np.ndarray:
+        """
+        Indices of the k largest values among candidates, largest first;
+        ties keep candidate order, like a stable sort would
+        """
+        if k <= 0:
+            return candidates[:0]
+        ranked = values[candidates]
+        if k < len(candidates):
+            # O(N) selection of the k-th largest value, then fill ties in order
+            kth = np.partition(ranked, len(ranked) - k)[len(ranked) - k]
+            keep = ranked > kth
+            ties = np.flatnonzero(ranked == kth)[:k - np.count_nonzero(keep)]
+            keep[ties] = True
+            candidates, ranked = candidates[keep], ranked[keep]
+        return candidates[np.argsort(-ranked, kind="stable")]
+    
+    def _trending_indices(self, raw: List[Dict], limit: int) -> np.ndarray:
+        liquidity = self._column(raw, "liquidity", "usd")
+        volume_1h = self._column(raw, "volume", "h1")
+        return self._top_k(volume_1h, np.flatnonzero(liquidity > 1000), limit)
+    
+    async def get_trending(self, chain: Chain, limit: int = 50) -> List[TokenPair]:
+        """Get trending tokens by volume"""
+        raw = await self._get_raw_pairs(chain)
+        if not raw: return []
         
-        pairs = [TokenPair.from_api(p) for p in data["pairs"] if p.get("liquidity", {}).get("usd", 0) > 1000]
-        pairs.sort(key=lambda p: p.volume_1h, reverse=True)
-        return pairs[:limit]
+        # Rank on raw columns; only build TokenPairs for the winners
+        return [TokenPair.from_api(raw[i]) for i in self._trending_indices(raw, limit)]
     
     async def get_gainers(self, chain: Chain, timeframe: str = "1h", limit: int = 20) -> List[TokenPair]:
         """Get top gainers"""
-        pairs = await self.get_trending(chain, 100)
+        raw = await self._get_raw_pairs(chain)
+        if not raw: return []
         
-        attr_map = {"5m": "price_change_5m", "1h": "price_change_1h", 
-                   "6h": "price_change_6h", "24h": "price_change_24h"}
-        attr = attr_map.get(timeframe, "price_change_1h")
+        key_map = {"5m": "m5", "1h": "h1", "6h": "h6", "24h": "h24"}
+        change = self._column(raw, "priceChange", key_map.get(timeframe, "h1"))
         
-        pairs.sort(key=lambda p: getattr(p, attr, 0), reverse=True)
-        return [p for p in pairs if getattr(p, attr, 0) > 0][:limit]
+        trending = self._trending_indices(raw, 100)
+        gaining = trending[change[trending] > 0]
+        return [TokenPair.from_api(raw[i]) for i in self._top_k(change, gaining, limit)]
     
     async def scan_new_tokens(self, chains: List[Chain], 
                               min_liquidity: float = 3000,
                               max_age_minutes: int = 30) -> List[tuple]:
         """Scan all chains for new tokens meeting criteria"""
         results = []
+        seen = self.seen_pairs
         
         for chain in chains:
             pairs = await self.get_new_pairs(chain, max_age_minutes)
+            self._expire_seen(time.monotonic())
             
             for pair in pairs:
                 # Skip if already seen recently
-                if pair.pair_address in self.seen_pairs:
-                    if (datetime.utcnow() - self.seen_pairs[pair.pair_address]).seconds < 300:
-                        continue
+                if pair.pair_address in seen:
+                    continue
                 
                 # Check minimum liquidity
                 if pair.liquidity_usd < min_liquidity:
                     continue
                 
-                self.seen_pairs[pair.pair_address] = datetime.utcnow()
+                seen[sys.intern(pair.pair_address)] = time.monotonic()
                 results.append((chain, pair))
-        
-        # Clean old seen pairs
-        if len(self.seen_pairs) > 5000:
-            cutoff = datetime.utcnow()
-            self.seen_pairs = {k: v for k, v in self.seen_pairs.items() 
-                             if (cutoff - v).seconds < 3600}
+            
+            # Bound memory, dropping the oldest entries first
+            while len(seen) > self.seen_max_size:
+                seen.popitem(last=False)
         
         return results
     
+    def _expire_seen(self, now: float):
+        """Drop seen pairs older than seen_ttl (entries are in insertion order)"""
+        seen = self.seen_pairs
+        while seen:
+            address, first_seen = next(iter(seen.items()))
+            if now - first_seen < self.seen_ttl:
+                break
+            del seen[address]
+    
     async def get_holder_info(self, chain: Chain, token_address: str) -> Dict:
         """Get holder distribution info (estimated from transactions)"""
         pairs = await self.get_token_pairs(chain, token_address)
@@ -5,17 +5,25 @@ Track and analyze winning wallets for copy trading signals
 
 import asyncio
 import aiohttp
-from typing import Dict, List, Optional, Set
+import heapq
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import logging
-import json
+import orjson
+
+from asyncio_throttle import Throttler
 
 from config.settings import Chain, API_CONFIG, SMART_WALLET_CONFIG
 from core.database import get_database, SmartWallet
+from utils.http import get_http_session
 
 logger = logging.getLogger(__name__)
 
+def canonical_address(address: str, chain: Chain) -> str:
+    """EVM hex addresses compare lowercased; Solana base58 is case-sensitive"""
+    return address if chain == Chain.SOL else address.lower()
+
 @dataclass
 class WalletActivity:
     """Activity record for a tracked wallet"""
@@ -73,11 +81,22 @@ class SmartWalletTracker:
     def __init__(self):
         self.tracked_wallets: Dict[str, WalletStats] = {}
         self.recent_activity: List[WalletActivity] = []
+        # Canonical token address -> entries of recent_activity, rebuilt with it
+        self._by_token: Dict[str, List[WalletActivity]] = {}
+        # (canonical token, chain) -> signals; valid until recent_activity is replaced
+        self._signal_cache: Dict[Tuple[str, str], Dict] = {}
+        # address -> last trade time for wallets whose stats await persisting
+        self._dirty: Dict[str, str] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._start_lock = asyncio.Lock()
+        self.flush_interval: float = 1.0
         self.session: Optional[aiohttp.ClientSession] = None
         self.watching_tokens: Set[str] = set()
+        self._scan_sem = asyncio.Semaphore(SMART_WALLET_CONFIG.scan_concurrency or 16)
+        self._scan_throttler = Throttler(rate_limit=SMART_WALLET_CONFIG.scan_rate_limit, period=1.0)
     
     async def start(self):
-        self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
+        self.session = await get_http_session()
         # Load tracked wallets from database
         db = await get_database()
         wallets = await db.get_smart_wallets()
@@ -86,21 +105,35 @@ class SmartWalletTracker:
                 address=w.address, chain=w.chain,
                 total_trades=w.total_trades, winning_trades=w.winning_trades,
                 total_profit_usd=w.total_profit,
-                tags=json.loads(w.tags) if w.tags else []
+                tags=orjson.loads(w.tags) if w.tags else []
             )
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_dirty_loop())
         logger.info(f"Smart Wallet Tracker started with {len(self.tracked_wallets)} wallets")
     
     async def stop(self):
-        if self.session:
-            await self.session.close()
-            self.session = None
+        if self._flush_task:
+            task, self._flush_task = self._flush_task, None
+            task.cancel()
+            # Let an in-flight flush unwind (and re-queue its batch) before the final one
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self._flush_dirty()
+        # Shared session; closed once by shutdown_http_session
+        self.session = None
     
     async def _request(self, url: str, headers: Dict = None) -> Optional[Dict]:
-        if not self.session: await self.start()
+        if not self.session:
+            # Double-checked so concurrent first requests run start() only once
+            async with self._start_lock:
+                if not self.session:
+                    await self.start()
         try:
             async with self.session.get(url, headers=headers) as response:
                 if response.status == 200:
-                    return await response.json()
+                    return orjson.loads(await response.read())
         except Exception as e:
             logger.warning(f"Wallet tracker request error: {e}")
         return None
@@ -147,7 +180,7 @@ class SmartWalletTracker:
         db = await get_database()
         await db.upsert_smart_wallet(SmartWallet(
             address=address, chain=chain.value,
-            tags=json.dumps(tags or [])
+            tags=orjson.dumps(tags or []).decode()
         ))
         
         logger.info(f"Added wallet to tracking: {address[:10]}... ({chain.value})")
@@ -184,16 +217,29 @@ class SmartWalletTracker:
         chain_wallets = [w for w in self.tracked_wallets.values() 
                         if w.chain == chain.value and w.qualifies()]
         
-        for wallet in chain_wallets[:SMART_WALLET_CONFIG.max_tracked_wallets]:
-            wallet_activities = await self.check_wallet_activity(wallet.address, chain)
-            activities.extend(wallet_activities)
-            await asyncio.sleep(0.1)  # Rate limiting
+        async def _one(wallet: WalletStats) -> List[WalletActivity]:
+            async with self._scan_sem, self._scan_throttler:
+                return await self.check_wallet_activity(wallet.address, chain)
+        
+        results = await asyncio.gather(
+            *(_one(w) for w in chain_wallets[:SMART_WALLET_CONFIG.max_tracked_wallets]),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.warning(f"Wallet scan error: {result}")
+            else:
+                activities.extend(result)
         
         # Sort by timestamp
         activities.sort(key=lambda a: a.timestamp, reverse=True)
         
-        # Update recent activity cache
-        self.recent_activity = activities[:100]
+        # Update recent activity cache and its token index
+        self.recent_activity = activities[:SMART_WALLET_CONFIG.activity_horizon]
+        self._by_token = {}
+        self._signal_cache = {}
+        for a in self.recent_activity:
+            self._by_token.setdefault(canonical_address(a.token, Chain(a.chain)), []).append(a)
         
         return activities
     
@@ -202,7 +248,12 @@ class SmartWalletTracker:
     # ============================================================
     
     async def get_smart_money_signals(self, token_address: str, chain: Chain) -> Dict:
-        """Get smart money signals for a token"""
+        """Get smart money signals for a token (cached per scan; treat as read-only)"""
+        key = (canonical_address(token_address, chain), chain.value)
+        cached = self._signal_cache.get(key)
+        if cached is not None:
+            return cached
+        
         signals = {
             "smart_wallets_buying": 0,
             "smart_wallets_selling": 0,
@@ -215,10 +266,7 @@ class SmartWalletTracker:
         }
         
         # Check recent activity for this token
-        token_activities = [a for a in self.recent_activity 
-                          if a.token.lower() == token_address.lower()]
-        
-        for activity in token_activities:
+        for activity in self._by_token.get(key[0], ()):
             if activity.action == "BUY":
                 signals["smart_wallets_buying"] += 1
                 signals["total_smart_volume_usd"] += activity.amount_usd
@@ -237,6 +285,7 @@ class SmartWalletTracker:
         if buys + sells > 0:
             signals["signal_strength"] = int((buys - sells) / (buys + sells) * 100)
         
+        self._signal_cache[key] = signals
         return signals
     
     async def is_smart_money_buying(self, token_address: str, chain: Chain) -> bool:
@@ -272,18 +321,48 @@ class SmartWalletTracker:
         else:
             stats.losing_trades += 1
         
-        # Save to database
-        db = await get_database()
-        await db.upsert_smart_wallet(SmartWallet(
-            address=address, chain=stats.chain,
-            total_trades=stats.total_trades,
-            winning_trades=stats.winning_trades,
-            total_profit=stats.total_profit_usd,
-            win_rate=stats.win_rate,
-            avg_return=stats.avg_return,
-            last_trade=datetime.utcnow().isoformat(),
-            tags=json.dumps(stats.tags)
-        ))
+        # Persisted by _flush_dirty_loop; repeat updates to one wallet merge into one write
+        self._dirty[address] = datetime.utcnow().isoformat()
+    
+    async def _flush_dirty_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self._flush_dirty()
+    
+    async def _flush_dirty(self):
+        """Write every wallet updated since the last flush in one batch"""
+        if not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, {}
+        wallets = []
+        for address, last_trade in dirty.items():
+            stats = self.tracked_wallets.get(address)
+            if not stats:
+                continue
+            wallets.append(SmartWallet(
+                address=address, chain=stats.chain,
+                total_trades=stats.total_trades,
+                winning_trades=stats.winning_trades,
+                total_profit=stats.total_profit_usd,
+                win_rate=stats.win_rate,
+                avg_return=stats.avg_return,
+                last_trade=last_trade,
+                tags=orjson.dumps(stats.tags).decode()
+            ))
+        try:
+            db = await get_database()
+            await db.upsert_smart_wallets_bulk(wallets)
+        except asyncio.CancelledError:
+            self._requeue_dirty(dirty)
+            raise
+        except Exception as e:
+            logger.warning(f"Wallet stats flush error: {e}")
+            self._requeue_dirty(dirty)
+    
+    def _requeue_dirty(self, dirty: Dict[str, str]):
+        # Keep newer updates that arrived during the failed write
+        for address, last_trade in dirty.items():
+            self._dirty.setdefault(address, last_trade)
     
     # ============================================================
     # LEADERBOARD
@@ -291,18 +370,17 @@ class SmartWalletTracker:
     
     def get_top_wallets(self, chain: Optional[Chain] = None, limit: int = 20) -> List[WalletStats]:
         """Get top performing wallets"""
-        wallets = list(self.tracked_wallets.values())
-        
-        if chain:
-            wallets = [w for w in wallets if w.chain == chain.value]
-        
-        # Filter to qualified only
-        wallets = [w for w in wallets if w.qualifies()]
-        
-        # Sort by profit
-        wallets.sort(key=lambda w: w.total_profit_usd, reverse=True)
+        # Single pass over qualified wallets; thresholds bound locally (same as qualifies())
+        min_trades = SMART_WALLET_CONFIG.min_total_trades
+        min_wr = SMART_WALLET_CONFIG.min_win_rate
+        chain_v = chain.value if chain else None
+        wallets = [w for w in self.tracked_wallets.values()
+                   if (chain_v is None or w.chain == chain_v)
+                   and w.total_trades >= min_trades
+                   and (w.winning_trades / w.total_trades if w.total_trades else 0) >= min_wr]
         
-        return wallets[:limit]
+        # Top by profit
+        return heapq.nlargest(limit, wallets, key=lambda w: w.total_profit_usd)
     
     def get_wallet_count(self, chain: Optional[Chain] = None) -> int:
         """Get count of tracked wallets"""
@@ -1,2 +1,3 @@
 """Utilities module"""
 from .telegram_logger import get_telegram_logger, shutdown_telegram_logger
+from .http import get_http_session, shutdown_http_session
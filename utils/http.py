@@ -0,0 +1,27 @@
+"""
+Moonshot Sniper Bot - Shared HTTP Session
+One pooled aiohttp session for the wallet tracker and Telegram logger
+"""
+
+import aiohttp
+from typing import Optional
+
+
+# Singleton
+_session: Optional[aiohttp.ClientSession] = None
+
+async def get_http_session() -> aiohttp.ClientSession:
+    """Shared session: one connector, DNS cache and keep-alive pool for all users"""
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(limit=256, limit_per_host=32, ttl_dns_cache=300,
+                                         use_dns_cache=True, keepalive_timeout=60)
+        _session = aiohttp.ClientSession(connector=connector,
+                                         timeout=aiohttp.ClientTimeout(total=30))
+    return _session
+
+async def shutdown_http_session():
+    global _session
+    if _session:
+        await _session.close()
+        _session = None
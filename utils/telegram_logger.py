@@ -5,14 +5,18 @@ Comprehensive logging system with 4 channels
 
 import asyncio
 import aiohttp
+import heapq
+import orjson
+from asyncio_throttle import Throttler
 from typing import Optional, Dict, List, Any
-from datetime import datetime
 from enum import Enum
 import logging
+import time
 
 from config.settings import Chain, TradingMode, TELEGRAM_CONFIG
 from engines.safety_engine import SafetyReport, SafetyStatus
 from scanners.dexscreener import TokenPair
+from utils.http import get_http_session
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +26,133 @@ class LogLevel(Enum):
     MEDIUM = 3
     LOW = 4
 
+# Telegram rejects messages over 4096 characters; leave headroom for the header
+MAX_MESSAGE_LEN = 4000
+JSON_HEADERS = {"Content-Type": "application/json"}
+# Bot API allows ~30 messages/s; stay under it and retry 429s a few times
+SEND_RATE_LIMIT = 25
+SEND_ATTEMPTS = 3
+MAX_RETRY_AFTER = 30  # seconds; longer 429 back-offs are clamped
+ERROR_BACKOFF = 0.5  # seconds a sender pauses after an unexpected error
+# Per-level queue bounds; LOW drops its oldest entries instead of blocking
+QUEUE_SIZES = {LogLevel.CRITICAL: 500, LogLevel.HIGH: 500,
+               LogLevel.MEDIUM: 500, LogLevel.LOW: 2000}
+
+def _utc_hms() -> str:
+    """Current UTC time as HH:MM:SS, without building a datetime"""
+    return time.strftime('%H:%M:%S', time.gmtime())
+
+# ============================================================
+# MESSAGE TEMPLATES
+# ============================================================
+# Filled with str.format_map; "$" is literal and "{name:spec}" takes the params
+
+_ENTRY_TMPL = """{badge} ✅ <b>ENTRY: ${symbol}</b>
+━━━━━━━━━━━━━━━━━━━━━
+{pool_icon} <b>Pool:</b> {pool}
+<b>Chain:</b> {chain}
+<b>Token:</b> <code>{token}</code>
+
+<b>✅ SAFETY PASSED</b>
+├── Tax: {tax_buy:.1f}%/{tax_sell:.1f}%
+├── LP: {lp}
+└── Holders: {holders}
+
+<b>✅ SCORE: {score}/100</b>
+
+<b>✅ CONFLUENCE: {signal_count} signals</b>
+{signal_lines}
+<b>💰 POSITION</b>
+├── Entry: ${entry_price:.10f}
+├── Size: ${size:.2f}
+├── Stop Loss: ${sl_price:.10f} (-{sl_pct:.0f}%)
+├── TP1: +50% | TP2: +100% | TP3: +200%
+
+<b>Time:</b> {time} UTC"""
+
+_TP_HIT_TMPL = """{badge} 🎯 <b>TP{level} HIT: ${symbol}</b>
+━━━━━━━━━━━━━━━━━━━━━
+<b>Sold:</b> {sell_pct:.0f}% (${sell_value:.2f})
+<b>Profit:</b> +${profit:.2f}
+<b>New SL:</b> ${new_sl:.10f}
+
+<b>Time:</b> {time} UTC"""
+
+_STOP_LOSS_TMPL = """{badge} 🛑 <b>STOPPED: ${symbol}</b>
+━━━━━━━━━━━━━━━━━━━━━
+<b>Exit Price:</b> ${exit_price:.10f}
+<b>Loss:</b> ${loss:.2f} ({loss_pct:.1f}%)
+<b>Reason:</b> {reason}
+
+<b>Time:</b> {time} UTC"""
+
+_EXIT_TMPL = """{badge} 💰 <b>CLOSED: ${symbol}</b>
+━━━━━━━━━━━━━━━━━━━━━
+<b>Result:</b> {result}
+<b>Pool:</b> {pool}
+
+<b>SUMMARY:</b>
+├── Entry: ${entry_price:.10f}
+├── Exit: ${exit_price:.10f}
+├── Return: {pnl_pct:+.1f}%
+├── P&L: ${pnl_usd:+.2f}
+└── Duration: {duration_min:.0f}m
+
+<b>Reason:</b> {reason}
+<b>Time:</b> {time} UTC"""
+
+_DAILY_SUMMARY_TMPL = """📈 <b>DAILY REPORT - {date}</b>
+━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{badge}
+
+<b>PORTFOLIO:</b>
+├── Starting: ${start_cap:.2f}
+├── Ending: ${end_cap:.2f}
+└── Day P&L: ${total_pnl:+.2f} ({pnl_pct:+.1f}%)
+
+<b>TRADING:</b>
+├── Tokens Scanned: {scanned:,}
+├── Trades: {trades}
+├── Winners: {winners} | Losers: {losers}
+└── Win Rate: {win_rate:.1f}%
+
+<b>POOLS:</b>
+├── SAFE P&L: ${safe_pnl:+.2f}
+└── HUNT P&L: ${hunt_pnl:+.2f}
+
+<b>TOP REJECTIONS:</b>
+{rejection_lines}
+<b>Time:</b> {time} UTC"""
+
+_STARTUP_TMPL = """🚀 <b>BOT STARTED</b>
+━━━━━━━━━━━━━━━━━━━━━
+<b>Mode:</b> {mode}
+<b>Capital:</b> ${capital:.2f}
+<b>Chains:</b> {chains}
+
+<b>Pools:</b>
+├── SAFE: {safe_pct}%
+└── HUNT: {hunt_pct}%
+
+<b>Time:</b> {time} UTC"""
+
+_ERROR_TMPL = """❌ <b>ERROR</b>
+━━━━━━━━━━━━━━━━━━━━━
+<b>Context:</b> {context}
+<b>Error:</b> {error}
+
+<b>Time:</b> {time} UTC"""
+
+_SYSTEM_TMPL = """{emoji} <b>SYSTEM: {level}</b>
+{message}
+<b>Time:</b> {time} UTC"""
+
+_POSITION_UPDATE_TMPL = """📊 <b>UPDATE: ${symbol}</b>
+├── Price: ${price:.10f}
+├── P&L: {pnl_pct:+.1f}%
+├── TPs Hit: {tp_hit}
+└── SL: ${sl:.10f}"""
+
 class TelegramLogger:
     """4-channel Telegram logging system"""
     
@@ -36,51 +167,149 @@ class TelegramLogger:
             LogLevel.MEDIUM: self.config.positions_channel,
             LogLevel.LOW: self.config.rejections_channel
         }
-        self.queue: List[tuple] = []
-        self.queue_lock = asyncio.Lock()
+        # One bounded queue and sender per level so alerts never wait behind LOW traffic
+        self._queues: Dict[LogLevel, asyncio.Queue] = {
+            level: asyncio.Queue(maxsize=QUEUE_SIZES[level]) for level in LogLevel
+        }
+        # (reason key, summary line); drained into one digest per flush interval
+        self.rejection_queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZES[LogLevel.LOW])
+        self.rejection_flush_interval: float = 2.0
+        self._workers: List[asyncio.Task] = []
+        self._throttler = Throttler(rate_limit=SEND_RATE_LIMIT, period=1.0)
     
     async def start(self):
         if self.enabled:
-            self.session = aiohttp.ClientSession()
-            asyncio.create_task(self._process_queue())
+            self.session = await get_http_session()
+            self._workers = [asyncio.create_task(self._process_queue(level))
+                             for level in LogLevel]
+            self._workers.append(asyncio.create_task(self._rejection_loop()))
             logger.info("Telegram Logger started")
     
     async def stop(self):
+        await self._flush_rejections()
         await self._flush_queue()
-        if self.session:
-            await self.session.close()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        # Shared session; closed once by shutdown_http_session
+        self.session = None
     
     async def _send(self, chat_id: str, text: str):
         if not self.enabled or not self.session or not chat_id:
             return
         url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
+        payload = orjson.dumps({
+            "chat_id": chat_id, "text": text,
+            "parse_mode": "HTML", "disable_web_page_preview": True
+        })
         try:
-            await self.session.post(url, json={
-                "chat_id": chat_id, "text": text,
-                "parse_mode": "HTML", "disable_web_page_preview": True
-            })
+            for attempt in range(1, SEND_ATTEMPTS + 1):
+                async with self._throttler:
+                    async with self.session.post(url, data=payload,
+                                                 headers=JSON_HEADERS) as response:
+                        if response.status != 429:
+                            return
+                        body = orjson.loads(await response.read())
+                if attempt == SEND_ATTEMPTS:
+                    logger.warning("Telegram rate limited, dropping message")
+                    return
+                # Telegram says exactly how long to back off
+                retry_after = min((body.get("parameters") or {}).get("retry_after", 1),
+                                  MAX_RETRY_AFTER)
+                logger.warning(f"Telegram rate limited, retrying in {retry_after}s")
+                await asyncio.sleep(retry_after)
         except Exception as e:
             logger.warning(f"Telegram error: {e}")
     
+    @staticmethod
+    def _put_drop_oldest(queue: asyncio.Queue, item):
+        """Enqueue without blocking, evicting the oldest entry when full"""
+        if queue.full():
+            queue.get_nowait()
+            queue.task_done()
+        queue.put_nowait(item)
+    
     async def _queue_message(self, level: LogLevel, text: str):
-        async with self.queue_lock:
-            self.queue.append((level, text))
+        if not self.enabled:
+            return
+        queue = self._queues[level]
+        if level == LogLevel.LOW:
+            self._put_drop_oldest(queue, text)
+        else:
+            await queue.put(text)
     
-    async def _process_queue(self):
+    async def _process_queue(self, level: LogLevel):
+        """Send one level's messages, merging a queued burst into one post"""
+        queue = self._queues[level]
+        chat_id = self.channels.get(level)
+        carry = None  # message that overflowed the previous post; starts the next one
         while True:
+            text = carry if carry is not None else await queue.get()
+            carry = None
+            taken = 1
+            while not queue.empty():
+                next_text = queue.get_nowait()
+                if len(text) + len(next_text) + 2 > MAX_MESSAGE_LEN:
+                    carry = next_text
+                    break
+                taken += 1
+                text += "\n\n" + next_text
             try:
-                async with self.queue_lock:
-                    if self.queue:
-                        level, text = self.queue.pop(0)
-                        await self._send(self.channels.get(level), text)
-            except: pass
-            await asyncio.sleep(0.1)
+                await self._send(chat_id, text)
+            except Exception:
+                logger.exception("Telegram queue error")
+                await asyncio.sleep(ERROR_BACKOFF)
+            finally:
+                for _ in range(taken):
+                    queue.task_done()
     
     async def _flush_queue(self):
-        async with self.queue_lock:
-            for level, text in self.queue:
+        if self._workers:
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*(q.join() for q in self._queues.values())), timeout=10)
+            except asyncio.TimeoutError:
+                logger.warning("Telegram queue flush timed out")
+            return
+        for level, queue in self._queues.items():
+            while not queue.empty():
+                text = queue.get_nowait()
+                queue.task_done()
                 await self._send(self.channels.get(level), text)
-            self.queue.clear()
+    
+    async def _rejection_loop(self):
+        while True:
+            await asyncio.sleep(self.rejection_flush_interval)
+            try:
+                await self._flush_rejections()
+            except Exception:
+                logger.exception("Telegram rejection flush error")
+                await asyncio.sleep(ERROR_BACKOFF)
+    
+    async def _flush_rejections(self):
+        """Send everything queued so far as digest messages grouped by reason"""
+        groups: Dict[str, List[str]] = {}
+        total = 0
+        while not self.rejection_queue.empty():
+            key, line = self.rejection_queue.get_nowait()
+            groups.setdefault(key, []).append(line)
+            total += 1
+        if not total:
+            return
+        
+        chat_id = self.channels.get(LogLevel.LOW)
+        text = f"""❌ <b>REJECTED: {total} tokens</b>
+<b>Time:</b> {_utc_hms()} UTC
+━━━━━━━━━━━━━━━━━━━━━"""
+        for key, lines in sorted(groups.items(), key=lambda g: -len(g[1])):
+            block = [f"\n<b>{key}</b> ({len(lines)})"] + lines
+            for part in block:
+                if len(text) + len(part) + 1 > MAX_MESSAGE_LEN:
+                    await self._send(chat_id, text)
+                    text = "❌ <b>REJECTED (cont.)</b>"
+                text += "\n" + part
+        await self._send(chat_id, text)
     
     # ============================================================
     # REJECTION LOGS
@@ -88,32 +317,22 @@ class TelegramLogger:
     
     async def log_rejection(self, pair: TokenPair, chain: Chain, 
                            safety: Optional[SafetyReport], score: int, reasons: List[str]):
-        if not self.config.log_rejections:
+        """Queue a one-line rejection; _rejection_loop posts them as a batched digest"""
+        if not self.enabled or not self.config.log_rejections:
             return
         
-        status = "❓ Unknown"
+        status = "❓"
         if safety:
-            status = {"safe": "✅ Passed", "warning": "⚠️ Warning", 
-                     "dangerous": "❌ Failed"}.get(safety.status.value, "❓")
+            status = {SafetyStatus.SAFE: "✅", SafetyStatus.WARNING: "⚠️", 
+                     SafetyStatus.DANGEROUS: "❌"}.get(safety.status, "❓")
         
-        text = f"""❌ <b>REJECTED: ${pair.base_token_symbol}</b>
-━━━━━━━━━━━━━━━━━━━━━
-<b>Chain:</b> {chain.value.upper()}
-<b>Token:</b> <code>{pair.base_token_address[:20]}...</code>
-<b>Age:</b> {pair.age_minutes:.1f}m
-
-<b>REASONS:</b>
-"""
-        for r in reasons[:5]:
-            text += f"├── {r}\n"
-        
-        text += f"""
-<b>Safety:</b> {status}
-<b>Score:</b> {score}/100
-<b>Liquidity:</b> ${pair.liquidity_usd:,.0f}
-<b>Time:</b> {datetime.utcnow().strftime('%H:%M:%S')} UTC"""
+        key = reasons[0].partition(":")[0] if reasons else "Unknown"
+        line = (f"├── ${pair.base_token_symbol} ({chain.value.upper()}) "
+                f"<code>{pair.base_token_address[:12]}…</code> "
+                f"{pair.age_minutes:.1f}m · ${pair.liquidity_usd:,.0f} · "
+                f"{score}/100 · {status} — {'; '.join(reasons[:5])}")
         
-        await self._queue_message(LogLevel.LOW, text)
+        self._put_drop_oldest(self.rejection_queue, (key, line))
     
     # ============================================================
     # ENTRY LOGS
@@ -123,37 +342,23 @@ class TelegramLogger:
                        safety: SafetyReport, score: int, signals: List[str],
                        size: float, entry_price: float, sl_price: float,
                        mode: TradingMode = TradingMode.SIMULATION):
+        if not self.enabled:
+            return
         
-        badge = "🎮 SIM" if mode == TradingMode.SIMULATION else "💰 LIVE"
-        pool_icon = "🛡️" if pool == "SAFE" else "🎯"
-        
-        text = f"""{badge} ✅ <b>ENTRY: ${pair.base_token_symbol}</b>
-━━━━━━━━━━━━━━━━━━━━━
-{pool_icon} <b>Pool:</b> {pool}
-<b>Chain:</b> {chain.value.upper()}
-<b>Token:</b> <code>{pair.base_token_address}</code>
-
-<b>✅ SAFETY PASSED</b>
-├── Tax: {safety.tax_buy:.1f}%/{safety.tax_sell:.1f}%
-├── LP: {"🔒 Locked" if safety.lp_locked else "⚠️ Unlocked"}
-└── Holders: {safety.holder_count}
-
-<b>✅ SCORE: {score}/100</b>
-
-<b>✅ CONFLUENCE: {len(signals)} signals</b>
-"""
-        for s in signals[:5]:
-            text += f"├── ✅ {s}\n"
-        
-        sl_pct = ((entry_price - sl_price) / entry_price * 100)
-        text += f"""
-<b>💰 POSITION</b>
-├── Entry: ${entry_price:.10f}
-├── Size: ${size:.2f}
-├── Stop Loss: ${sl_price:.10f} (-{sl_pct:.0f}%)
-├── TP1: +50% | TP2: +100% | TP3: +200%
-
-<b>Time:</b> {datetime.utcnow().strftime('%H:%M:%S')} UTC"""
+        text = _ENTRY_TMPL.format_map({
+            "badge": "🎮 SIM" if mode == TradingMode.SIMULATION else "💰 LIVE",
+            "pool_icon": "🛡️" if pool == "SAFE" else "🎯",
+            "pool": pool, "chain": chain.value.upper(),
+            "symbol": pair.base_token_symbol, "token": pair.base_token_address,
+            "tax_buy": safety.tax_buy, "tax_sell": safety.tax_sell,
+            "lp": "🔒 Locked" if safety.lp_locked else "⚠️ Unlocked",
+            "holders": safety.holder_count, "score": score,
+            "signal_count": len(signals),
+            "signal_lines": "".join(f"├── ✅ {s}\n" for s in signals[:5]),
+            "entry_price": entry_price, "size": size, "sl_price": sl_price,
+            "sl_pct": (entry_price - sl_price) / entry_price * 100,
+            "time": _utc_hms(),
+        })
         
         await self._queue_message(LogLevel.HIGH, text)
     
@@ -164,30 +369,30 @@ class TelegramLogger:
     async def log_tp_hit(self, symbol: str, level: int, sell_pct: float,
                         sell_value: float, profit: float, new_sl: float,
                         mode: TradingMode = TradingMode.SIMULATION):
-        badge = "🎮 SIM" if mode == TradingMode.SIMULATION else "💰 LIVE"
+        if not self.enabled:
+            return
         
-        text = f"""{badge} 🎯 <b>TP{level} HIT: ${symbol}</b>
-━━━━━━━━━━━━━━━━━━━━━
-<b>Sold:</b> {sell_pct:.0f}% (${sell_value:.2f})
-<b>Profit:</b> +${profit:.2f}
-<b>New SL:</b> ${new_sl:.10f}
-
-<b>Time:</b> {datetime.utcnow().strftime('%H:%M:%S')} UTC"""
+        text = _TP_HIT_TMPL.format_map({
+            "badge": "🎮 SIM" if mode == TradingMode.SIMULATION else "💰 LIVE",
+            "symbol": symbol, "level": level, "sell_pct": sell_pct,
+            "sell_value": sell_value, "profit": profit, "new_sl": new_sl,
+            "time": _utc_hms(),
+        })
         
         await self._queue_message(LogLevel.HIGH, text)
     
     async def log_stop_loss(self, symbol: str, exit_price: float, 
                            loss: float, loss_pct: float, reason: str,
                            mode: TradingMode = TradingMode.SIMULATION):
-        badge = "🎮 SIM" if mode == TradingMode.SIMULATION else "💰 LIVE"
+        if not self.enabled:
+            return
         
-        text = f"""{badge} 🛑 <b>STOPPED: ${symbol}</b>
-━━━━━━━━━━━━━━━━━━━━━
-<b>Exit Price:</b> ${exit_price:.10f}
-<b>Loss:</b> ${loss:.2f} ({loss_pct:.1f}%)
-<b>Reason:</b> {reason}
-
-<b>Time:</b> {datetime.utcnow().strftime('%H:%M:%S')} UTC"""
+        text = _STOP_LOSS_TMPL.format_map({
+            "badge": "🎮 SIM" if mode == TradingMode.SIMULATION else "💰 LIVE",
+            "symbol": symbol, "exit_price": exit_price, "loss": loss,
+            "loss_pct": loss_pct, "reason": reason,
+            "time": _utc_hms(),
+        })
         
         await self._queue_message(LogLevel.HIGH, text)
     
@@ -199,23 +404,17 @@ class TelegramLogger:
                       exit_price: float, pnl_usd: float, pnl_pct: float,
                       reason: str, duration_min: float,
                       mode: TradingMode = TradingMode.SIMULATION):
-        badge = "🎮 SIM" if mode == TradingMode.SIMULATION else "💰 LIVE"
-        result = "🏆 WINNER" if pnl_usd >= 0 else "❌ LOSER"
+        if not self.enabled:
+            return
         
-        text = f"""{badge} 💰 <b>CLOSED: ${symbol}</b>
-━━━━━━━━━━━━━━━━━━━━━
-<b>Result:</b> {result}
-<b>Pool:</b> {pool}
-
-<b>SUMMARY:</b>
-├── Entry: ${entry_price:.10f}
-├── Exit: ${exit_price:.10f}
-├── Return: {pnl_pct:+.1f}%
-├── P&L: ${pnl_usd:+.2f}
-└── Duration: {duration_min:.0f}m
-
-<b>Reason:</b> {reason}
-<b>Time:</b> {datetime.utcnow().strftime('%H:%M:%S')} UTC"""
+        text = _EXIT_TMPL.format_map({
+            "badge": "🎮 SIM" if mode == TradingMode.SIMULATION else "💰 LIVE",
+            "result": "🏆 WINNER" if pnl_usd >= 0 else "❌ LOSER",
+            "symbol": symbol, "pool": pool, "entry_price": entry_price,
+            "exit_price": exit_price, "pnl_pct": pnl_pct, "pnl_usd": pnl_usd,
+            "duration_min": duration_min, "reason": reason,
+            "time": _utc_hms(),
+        })
         
         await self._queue_message(LogLevel.HIGH, text)
     
@@ -228,37 +427,24 @@ class TelegramLogger:
                                safe_pnl: float, hunt_pnl: float,
                                scanned: int, rejections: Dict[str, int],
                                mode: TradingMode = TradingMode.SIMULATION):
-        badge = "🎮 SIMULATION" if mode == TradingMode.SIMULATION else "💰 LIVE"
-        total_pnl = end_cap - start_cap
-        pnl_pct = (total_pnl / start_cap * 100) if start_cap > 0 else 0
-        win_rate = (winners / trades * 100) if trades > 0 else 0
+        if not self.enabled:
+            return
         
-        text = f"""📈 <b>DAILY REPORT - {date}</b>
-━━━━━━━━━━━━━━━━━━━━━━━━━━━
-{badge}
-
-<b>PORTFOLIO:</b>
-├── Starting: ${start_cap:.2f}
-├── Ending: ${end_cap:.2f}
-└── Day P&L: ${total_pnl:+.2f} ({pnl_pct:+.1f}%)
-
-<b>TRADING:</b>
-├── Tokens Scanned: {scanned:,}
-├── Trades: {trades}
-├── Winners: {winners} | Losers: {losers}
-└── Win Rate: {win_rate:.1f}%
-
-<b>POOLS:</b>
-├── SAFE P&L: ${safe_pnl:+.2f}
-└── HUNT P&L: ${hunt_pnl:+.2f}
-
-<b>TOP REJECTIONS:</b>
-"""
-        for reason, count in sorted(rejections.items(), key=lambda x: -x[1])[:5]:
-            text += f"├── {reason}: {count}\n"
+        total_pnl = end_cap - start_cap
+        top_rejections = heapq.nlargest(5, rejections.items(), key=lambda kv: kv[1])
         
-        text += f"""
-<b>Time:</b> {datetime.utcnow().strftime('%H:%M:%S')} UTC"""
+        text = _DAILY_SUMMARY_TMPL.format_map({
+            "date": date,
+            "badge": "🎮 SIMULATION" if mode == TradingMode.SIMULATION else "💰 LIVE",
+            "start_cap": start_cap, "end_cap": end_cap, "total_pnl": total_pnl,
+            "pnl_pct": (total_pnl / start_cap * 100) if start_cap > 0 else 0,
+            "scanned": scanned, "trades": trades,
+            "winners": winners, "losers": losers,
+            "win_rate": (winners / trades * 100) if trades > 0 else 0,
+            "safe_pnl": safe_pnl, "hunt_pnl": hunt_pnl,
+            "rejection_lines": "".join(f"├── {r}: {c}\n" for r, c in top_rejections),
+            "time": _utc_hms(),
+        })
         
         await self._queue_message(LogLevel.CRITICAL, text)
     
@@ -267,49 +453,55 @@ class TelegramLogger:
     # ============================================================
     
     async def log_startup(self, config: Dict):
-        text = f"""🚀 <b>BOT STARTED</b>
-━━━━━━━━━━━━━━━━━━━━━
-<b>Mode:</b> {config.get('mode', 'SIMULATION')}
-<b>Capital:</b> ${config.get('capital', 100):.2f}
-<b>Chains:</b> {', '.join(config.get('chains', []))}
-
-<b>Pools:</b>
-├── SAFE: {config.get('safe_pct', 60)}%
-└── HUNT: {config.get('hunt_pct', 40)}%
-
-<b>Time:</b> {datetime.utcnow().strftime('%H:%M:%S')} UTC"""
+        if not self.enabled:
+            return
+        
+        text = _STARTUP_TMPL.format_map({
+            "mode": config.get('mode', 'SIMULATION'),
+            "capital": config.get('capital', 100),
+            "chains": ', '.join(config.get('chains', [])),
+            "safe_pct": config.get('safe_pct', 60),
+            "hunt_pct": config.get('hunt_pct', 40),
+            "time": _utc_hms(),
+        })
         
         await self._queue_message(LogLevel.CRITICAL, text)
     
     async def log_error(self, error: str, context: str = ""):
-        text = f"""❌ <b>ERROR</b>
-━━━━━━━━━━━━━━━━━━━━━
-<b>Context:</b> {context}
-<b>Error:</b> {error}
-
-<b>Time:</b> {datetime.utcnow().strftime('%H:%M:%S')} UTC"""
+        if not self.enabled:
+            return
+        
+        text = _ERROR_TMPL.format_map({
+            "context": context, "error": error,
+            "time": _utc_hms(),
+        })
         
         await self._queue_message(LogLevel.CRITICAL, text)
     
     async def log_system(self, message: str, level: str = "INFO"):
-        emoji = {"INFO": "ℹ️", "WARNING": "⚠️", "ERROR": "❌"}.get(level, "ℹ️")
-        text = f"""{emoji} <b>SYSTEM: {level}</b>
-{message}
-<b>Time:</b> {datetime.utcnow().strftime('%H:%M:%S')} UTC"""
+        if not self.enabled:
+            return
+        
+        text = _SYSTEM_TMPL.format_map({
+            "emoji": {"INFO": "ℹ️", "WARNING": "⚠️", "ERROR": "❌"}.get(level, "ℹ️"),
+            "level": level, "message": message,
+            "time": _utc_hms(),
+        })
         
         await self._queue_message(LogLevel.MEDIUM, text)
     
     async def log_position_update(self, symbol: str, price: float, pnl_pct: float,
                                  tp_hit: List[int], sl: float):
-        text = f"""📊 <b>UPDATE: ${symbol}</b>
-├── Price: ${price:.10f}
-├── P&L: {pnl_pct:+.1f}%
-├── TPs Hit: {tp_hit}
-└── SL: ${sl:.10f}"""
+        if not self.enabled:
+            return
+        
+        text = _POSITION_UPDATE_TMPL.format_map({
+            "symbol": symbol, "price": price, "pnl_pct": pnl_pct,
+            "tp_hit": tp_hit, "sl": sl,
+        })
         
         await self._queue_message(LogLevel.MEDIUM, text)
 
-
 # Singleton
 _telegram: Optional[TelegramLogger] = None
 